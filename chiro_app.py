@@ -37,11 +37,14 @@
 #If not in ROOT folder, make sure to "cd chiro_emr_desktop" without the quotes
 #testing git push / pull
 # chiro_app.py
+import hashlib
 import json
 import os
 import sys
 import subprocess
+import tempfile
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from tkinter import ttk, messagebox, filedialog, simpledialog
 from datetime import datetime, timezone
 from diagnosis_page import DiagnosisPage
@@ -115,8 +118,9 @@ import copy
 from master_save import MasterSaveController
 from config import (
     UI_PAGES,
-    EXAM_COLORS,
+    exam_color_theme,
     REGION_LABELS,
+    REGION_LABEL_VALUES,
     SETTINGS_PATH,
     AUTOSAVE_DEBOUNCE_MS,
     LOGO_PATH, PROVIDER_NAME, CLINIC_NAME, CLINIC_ADDR, CLINIC_PHONE_FAX,
@@ -146,6 +150,14 @@ try:
 except Exception:
     PIL_OK = False
 
+# ----------- OPTIONAL: orjson (fast JSON for exam/settings files) -----------
+ORJSON_OK = False
+try:
+    import orjson  # type: ignore
+    ORJSON_OK = True
+except Exception:
+    ORJSON_OK = False
+
 EXAM_INDEX_FILENAME = "_exam_index.json"
 
 # No base exams; only dynamic exams (Initial 1, Re-Exam 1, etc.)
@@ -192,22 +204,138 @@ def get_templates_root() -> Path:
     return root
 
 
-def _find_sets(obj, path="root"):
-    if isinstance(obj, set):
-        print("FOUND set at:", path, "=>", obj)
-        return True
+def _normalize_objectives_struct(raw) -> dict:
+    """Objectives builder state as saved: dict ``global`` (legacy ``globals``), list ``blocks``, optional ``canvas``."""
+    obj_struct: dict = {"global": {}, "blocks": []}
+    if isinstance(raw, dict):
+        g = raw.get("global")
+        if g is None:
+            g = raw.get("globals")
+        obj_struct["global"] = g if isinstance(g, dict) else {}
+        b = raw.get("blocks")
+        obj_struct["blocks"] = b if isinstance(b, list) else []
+        canv = raw.get("canvas")
+        if isinstance(canv, dict):
+            obj_struct["canvas"] = canv
+    return obj_struct
+
+
+def _normalize_saved_exam_payload(payload) -> dict:
+    """
+    Shape a saved exam JSON like App.make_payload() output for PDF export:
+    objectives_struct always has dict ``global`` + list ``blocks`` (legacy
+    ``globals`` accepted) and the visit date is normalized to MM/DD/YYYY.
+    """
+    if not isinstance(payload, dict):
+        return {}
+
+    soap = payload.get("soap")
+    if not isinstance(soap, dict):
+        soap = {}
+        payload["soap"] = soap
+
+    soap["objectives_struct"] = _normalize_objectives_struct(soap.get("objectives_struct"))
+
+    patient = payload.get("patient")
+    if not isinstance(patient, dict):
+        patient = {}
+        payload["patient"] = patient
+    patient["exam_date"] = normalize_mmddyyyy(patient.get("exam_date", "")) or today_mmddyyyy()
+
+    return payload
 
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if _find_sets(v, f"{path}.{k}"):
-                return True
 
-    if isinstance(obj, list):
-        for i, v in enumerate(obj):
-            if _find_sets(v, f"{path}[{i}]"):
-                return True
+def _load_saved_exam_payload(path: str) -> dict:
+    """Read one exam JSON and shape it for PDF export (safe to run off the Tk thread)."""
+    with open(path, "rb") as f:
+        return _normalize_saved_exam_payload(_json_loads(f.read()))
 
-    return False
+
+def _json_default(obj):
+    """``default=`` hook: sets (rejected by json/orjson) become sorted lists during encoding."""
+    if isinstance(obj, (set, frozenset)):
+        try:
+            return sorted(obj)
+        except TypeError:
+            return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps_indent2(value) -> str:
+    """indent=2 JSON text: orjson when installed (C encoder), stdlib json otherwise."""
+    if ORJSON_OK:
+        return orjson.dumps(
+            value,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(value, indent=2, default=_json_default)
+
+
+def _json_loads(data: bytes | str):
+    """Parse JSON text/bytes with orjson when installed, stdlib json otherwise."""
+    if ORJSON_OK:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_fragment(value, depth: int = 0) -> str:
+    """``_json_dumps_indent2(value)`` re-indented to sit ``depth`` levels deep in a larger document."""
+    text = _json_dumps_indent2(value)
+    if depth:
+        # Safe: JSON strings escape newlines, so every raw "\n" is layout.
+        text = text.replace("\n", "\n" + "  " * depth)
+    return text
+
+
+def _json_same(a, b) -> bool:
+    """
+    Strict equality for JSON-shaped values: types must match exactly (so 1, 1.0
+    and True differ) and dict key order counts, since both change the dumped text.
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return (
+            len(a) == len(b)
+            and all(ka == kb and _json_same(a[ka], b[kb]) for ka, kb in zip(a, b))
+        )
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_json_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _json_object_from_fragments(members: list[tuple[str, str]], depth: int = 0) -> str:
+    """Join ``(key, fragment)`` pairs into an indent=2 JSON object laid out like json.dumps."""
+    if not members:
+        return "{}"
+    pad = "  " * (depth + 1)
+    body = ",\n".join(f"{pad}{json.dumps(k)}: {frag}" for k, frag in members)
+    return "{\n" + body + "\n" + "  " * depth + "}"
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a unique temp file in the same folder + os.replace (safe off the Tk thread)."""
+    with tempfile.NamedTemporaryFile(
+        mode="wb", dir=str(path.parent), prefix=path.stem + ".", suffix=".tmp", delete=False
+    ) as tf:
+        tmp_name = tf.name
+        try:
+            tf.write(data)
+            tf.flush()
+            os.fsync(tf.fileno())
+        except Exception:
+            tf.close()
+            os.remove(tmp_name)
+            raise
+    try:
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        raise
 
 # Patient ID and folder paths: patient_storage.new_patient_id, get_patient_root, find_patient_root
 
@@ -307,17 +435,51 @@ def _next_number(existing: list[str], prefix: str) -> int:
     return n
 
 
+def _resolve_page_resetter(page, candidates: list[tuple[str, tuple, dict]]):
+    """
+    Return a zero-arg callable for the first ``(method, args, kwargs)`` the page
+    exposes, or None. Resolved once so clearing sections never probes APIs via
+    exceptions.
+    """
+    for name, args, kwargs in candidates:
+        fn = getattr(page, name, None)
+        if callable(fn):
+            return lambda fn=fn, args=args, kwargs=kwargs: fn(*args, **kwargs)
+    return None
+
+
+def _init_styles(root: tk.Misc) -> None:
+    """Install the app's named ttk button styles once per Tk interpreter."""
+    if getattr(root, "_styles_ready", False):
+        return
+    style = ttk.Style(root)
+
+    style.configure("ActiveExam.TButton", font=("Segoe UI", 10, "bold"))
+    style.configure("AddExam.TButton", font=("Segoe UI", 10, "bold"), padding=(10, 4))
+    style.map(
+        "AddExam.TButton",
+        foreground=[("!disabled", "#7a1f1f")],   # dark red text
+        background=[("active", "#f5c6c6")]
+    )
+
+    # Referral toggle buttons (demographics)
+    style.configure("Ref.Inactive.TButton", font=("Segoe UI", 9), padding=(6, 3))
+    style.configure("Ref.Active.TButton", font=("Segoe UI", 9, "bold"), padding=(6, 3))
+    style.map(
+        "Ref.Active.TButton",
+        foreground=[("!disabled", "#0a4d0a")],
+        background=[("active", "#cfe9cf")],
+    )
+
+    root._styles_ready = True
+
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
         ensure_year_root()    
 
-        style = ttk.Style()
-
-        style.configure(
-            "ActiveExam.TButton",
-            font=("Segoe UI", 10, "bold")
-        )
+        _init_styles(self)
 
         self._alerts_popup_open = False
 
@@ -391,11 +553,40 @@ class App(tk.Tk):
         self.current_page = tk.StringVar(value="HOI History")
 
         self.exams: list[str] = list(EMPTY_EXAMS)  # dynamic exam list (Initial 1, Re-Exam 1, ROF 1, etc.)
+        self.exams_lc: set[str] = {e.lower() for e in self.exams}  # kept in step by _set_exams
 
         self._autosave_after_id = None
         self.current_case_path: str | None = None
         self._loading = False
 
+        # Parsed SETTINGS_PATH contents; writes are merged here and flushed debounced.
+        self._settings_cache: dict | None = None
+        self._settings_pending: dict = {}
+        self._settings_flush_after_id = None
+
+        # Exam JSON writes run on a single worker so disk I/O never stalls typing.
+        # One worker keeps writes ordered; _save_pending coalesces autosaves that
+        # arrive while a write is still in flight into one follow-up save.
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exam-save")
+        # ReportLab rendering for PDF exports (see _run_with_busy_dialog).
+        self._pdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-export")
+        self._save_in_flight = False
+        self._save_pending = False
+        # (future, path, exam, digest, token) of the running background write; the
+        # worker never calls into Tk, the Tk thread polls it (_poll_background_save).
+        self._bg_save = None
+        self._bg_save_after_id = None
+        # Per-section JSON fragments from the last save: soap key -> (decoded snapshot, text).
+        # Unchanged sections are spliced back in instead of being re-serialized.
+        self._soap_fragment_cache: dict[str, tuple[object, str]] = {}
+        # Content digest + file mtime of the last write per exam path, so idle
+        # debounces that would rewrite identical bytes are skipped.
+        self._saved_digests: dict[str, tuple[bytes, int]] = {}
+        self._save_tokens: dict[str, int] = {}
+        self._save_token_seq = 0
+        # Sections known to have content (see _section_has_content).
+        self._has_content_cache: dict[str, bool] = {}
+
         self.last_exam_pdf_paths: dict[str, str] = {}
         self.last_imaging_letter_pdf_paths: dict[str, list[str]] = {}
         self.last_modalities_letter_pdf_paths: dict[str, str] = {}
@@ -435,6 +626,14 @@ class App(tk.Tk):
 
         self.current_patient_id = None
 
+        # Memoized patient folder / exam paths (see get_current_patient_root).
+        self._patient_root_cache: tuple[tuple[str, str, str], str] | None = None
+        self._dirs_ensured: set[str] = set()
+        self._exam_path_cache: dict[tuple[str, str], str] = {}
+
+        # Header / demographics / exam-colour passes queued for the next idle cycle.
+        self._pending_apply: set[str] = set()
+
         self._patient_search_popup = None
         self._patient_search_listbox = None
         self._patient_search_after_id = None
@@ -455,7 +654,7 @@ class App(tk.Tk):
         self._build_ui()       
         self._wire_autosave_triggers()
 
-        self._apply_demographics_visibility()
+        self._schedule_apply("demo")
 
         # When launched from the shell, intercept the close button so we can
         # mirror the active patient back to the shell state file before exit.
@@ -527,16 +726,22 @@ class App(tk.Tk):
             os.replace(tmp, path)
   
 
-    def _date_for_exam_button(self, exam_name: str) -> str:
+    def _date_for_exam_button(self, exam_name: str, saved_files: set[str] | None = None) -> str:
         """
         Return the exam's saved exam_date (from its JSON) if it exists,
         otherwise fall back to the current demographics exam_date.
+        ``saved_files`` (from _saved_exam_filenames) replaces the per-exam stat.
         """
         # Fallback first
         fallback = (self.exam_date_var.get() or "").strip()
 
         path = self.compute_exam_path(exam_name)
-        if not path or not os.path.exists(path):
+        if not path:
+            return fallback
+        if saved_files is not None:
+            if os.path.basename(path) not in saved_files:
+                return fallback
+        elif not os.path.exists(path):
             return fallback
 
         try:
@@ -1414,12 +1619,7 @@ class App(tk.Tk):
             return
         
         # Subjectives body-region headings...
-        try:
-            from config import REGION_LABELS
-        except Exception:
-            REGION_LABELS = {}
-
-        if line_content in REGION_LABELS.values():
+        if line_content in REGION_LABEL_VALUES:
             section_name = "Subjectives"
             self.show_page("Subjectives", scroll_live_preview=False)
             self._handle_preview_subheading_click(section_name, line_content)
@@ -1610,12 +1810,8 @@ class App(tk.Tk):
             # Subjectives Live Preview prints REGION_LABELS as headings, e.g. "Cervical Spine"
             # We treat any known body-region label as a click on that block.
             if hasattr(self, "subjectives_page") and hasattr(self.subjectives_page, "focus_region_label"):
-                try:
-                    from config import REGION_LABELS  # local import to avoid cycles at top
-                except Exception:
-                    REGION_LABELS = {}
                 # If this line matches any REGION_LABELS value, try to focus that block.
-                if line in REGION_LABELS.values():
+                if line in REGION_LABEL_VALUES:
                     self.subjectives_page.focus_region_label(line)
             return
 
@@ -1746,13 +1942,16 @@ class App(tk.Tk):
             except Exception:
                 pass
         self.exam_buttons.clear()
+        self._active_exam_name = None
 
         # Ensure current patient’s dynamic exams are loaded if we have a patient
         # (only do this once patient info exists; otherwise keep EMPTY_EXAMS)
-        if self.get_current_patient_root():
-            self.exams = self._load_dynamic_exams_for_patient()
+        patient_root = self.get_current_patient_root()
+        if patient_root:
+            self._set_exams(self._load_dynamic_exams_for_patient())
         else:
-            self.exams = list(EMPTY_EXAMS)
+            self._set_exams(list(EMPTY_EXAMS))
+        saved_files = self._saved_exam_filenames(patient_root) if patient_root else set()
 
         # Recreate buttons (insert before the + buttons, which we pack on the right)
         for exam in self.exams:
@@ -1764,7 +1963,7 @@ class App(tk.Tk):
             if parent is None:
                 return
 
-            date_str = self._date_for_exam_button(exam)
+            date_str = self._date_for_exam_button(exam, saved_files)
             btn_text = f"{date_str}   {label}"
             btn = ttk.Button(parent, text=btn_text, command=lambda e=exam: self.switch_exam(e))
             btn.pack(fill="x", pady=4)
@@ -1772,8 +1971,13 @@ class App(tk.Tk):
 
 
         self._refresh_exam_button_styles()
-        self._apply_exam_color_theme()        
+        self._schedule_apply("theme")
+
 
+    def _set_exams(self, exams: list[str]) -> None:
+        """Replace the exam list; keeps the lowercase lookup set in step."""
+        self.exams = list(exams)
+        self.exams_lc = {e.lower() for e in self.exams}
 
     def _ensure_patient_for_dynamic_exam(self) -> bool:
         self._ensure_current_patient_id()
@@ -2099,8 +2303,7 @@ class App(tk.Tk):
             return
 
         # de-dupe by case-insensitive name
-        existing_lower = {e.lower() for e in self.exams}
-        if exam_name.lower() in existing_lower:
+        if exam_name.lower() in self.exams_lc:
             self.switch_exam(exam_name)
             return
 
@@ -2111,7 +2314,7 @@ class App(tk.Tk):
             pass
 
         # Add to list + persist + rebuild UI
-        self.exams.append(exam_name)
+        self._set_exams([*self.exams, exam_name])
         self._save_dynamic_exams_for_patient()
         self._rebuild_exam_nav_buttons()
 
@@ -2173,7 +2376,7 @@ class App(tk.Tk):
         self.current_exam.set(exam_name)
         self._set_current_doc_label()
         self._refresh_exam_button_styles()
-        self._apply_exam_color_theme()
+        self._schedule_apply("theme")
         # ✅ NEW: set today's visit date for a newly created exam (first time)
         self.exam_date_var.set(today_mmddyyyy())
         self._set_current_doc_label()        
@@ -2301,7 +2504,7 @@ class App(tk.Tk):
 
         # 3) Remove from in-memory lists/maps
         try:
-            self.exams = [e for e in self.exams if e != exam_name]
+            self._set_exams([e for e in self.exams if e != exam_name])
             # Persist updated exam list into _exam_index.json in index_exam_number/
             self._save_dynamic_exams_for_patient()
         except Exception:
@@ -2419,10 +2622,7 @@ class App(tk.Tk):
         except Exception:
             pass
 
-        try:
-            self._apply_exam_color_theme()
-        except Exception:
-            pass
+        self._schedule_apply("theme")
 
         try:
             self.tk_docs_page.refresh()
@@ -3315,7 +3515,7 @@ class App(tk.Tk):
         except Exception as e:
             print("Referral letter auto-sync failed:", e)
         try:
-            self.doc_vault_page.refresh_current_folder()
+            self._refresh_doc_vault()
         except Exception:
             pass
 
@@ -3533,7 +3733,7 @@ class App(tk.Tk):
                 except Exception:
                     pass
                 try:
-                    self.doc_vault_page.refresh_current_folder()
+                    self._refresh_doc_vault()
                 except Exception:
                     pass
             except Exception as e:
@@ -3713,7 +3913,7 @@ class App(tk.Tk):
                 except Exception:
                     pass
                 try:
-                    self.doc_vault_page.refresh_current_folder()
+                    self._refresh_doc_vault()
                 except Exception:
                     pass
             except Exception as e:
@@ -4034,7 +4234,7 @@ class App(tk.Tk):
                             rx_pdf_path = vp
                             break
                     try:
-                        self.doc_vault_page.refresh_current_folder()
+                        self._refresh_doc_vault()
                     except Exception:
                         pass
                 else:
@@ -4193,9 +4393,8 @@ class App(tk.Tk):
         if not patient_root or not REPORTLAB_OK:
             return []
 
-        ensure_patient_dirs(patient_root)
+        self._ensure_patient_dirs(patient_root, PATIENT_SUBDIR_PDFS)
         pdf_dir = os.path.join(patient_root, PATIENT_SUBDIR_PDFS)
-        os.makedirs(pdf_dir, exist_ok=True)
 
         date_str = normalize_mmddyyyy(self.exam_date_var.get()) or today_mmddyyyy()
         date_slug = safe_slug(date_str)
@@ -4405,7 +4604,7 @@ class App(tk.Tk):
         except Exception:
             pass
         try:
-            self.doc_vault_page.refresh_current_folder()
+            self._refresh_doc_vault()
         except Exception:
             pass
 
@@ -4500,7 +4699,7 @@ class App(tk.Tk):
         except Exception:
             pass
         try:
-            self.doc_vault_page.refresh_current_folder()
+            self._refresh_doc_vault()
         except Exception:
             pass
 
@@ -4537,7 +4736,7 @@ class App(tk.Tk):
                 except Exception:
                     pass
                 try:
-                    self.doc_vault_page.refresh_current_folder()
+                    self._refresh_doc_vault()
                 except Exception:
                     pass
             except Exception as e:
@@ -4718,9 +4917,8 @@ class App(tk.Tk):
         if not should or not patient_root or not REPORTLAB_OK:
             return ""
 
-        ensure_patient_dirs(patient_root)
+        self._ensure_patient_dirs(patient_root, PATIENT_SUBDIR_PDFS)
         pdf_dir = os.path.join(patient_root, PATIENT_SUBDIR_PDFS)
-        os.makedirs(pdf_dir, exist_ok=True)
 
         date_str = normalize_mmddyyyy(self.exam_date_var.get()) or today_mmddyyyy()
         date_slug = safe_slug(date_str)
@@ -5005,7 +5203,7 @@ class App(tk.Tk):
         except Exception as e:
             print("Imaging letter auto-sync failed:", e)
         try:
-            self.doc_vault_page.refresh_current_folder()
+            self._refresh_doc_vault()
         except Exception:
             pass
 
@@ -5053,7 +5251,7 @@ class App(tk.Tk):
                 except Exception:
                     pass
                 try:
-                    self.doc_vault_page.refresh_current_folder()
+                    self._refresh_doc_vault()
                 except Exception:
                     pass
             except Exception as e:
@@ -5266,7 +5464,7 @@ class App(tk.Tk):
                 except Exception:
                     pass
                 try:
-                    self.doc_vault_page.refresh_current_folder()
+                    self._refresh_doc_vault()
                 except Exception:
                     pass
             except Exception as e:
@@ -5456,7 +5654,7 @@ class App(tk.Tk):
                             rx_pdf_path = vp
                             break
                     try:
-                        self.doc_vault_page.refresh_current_folder()
+                        self._refresh_doc_vault()
                     except Exception:
                         pass
                 else:
@@ -5652,9 +5850,8 @@ class App(tk.Tk):
         if not patient_root or not REPORTLAB_OK:
             return []
 
-        ensure_patient_dirs(patient_root)
+        self._ensure_patient_dirs(patient_root, PATIENT_SUBDIR_PDFS)
         pdf_dir = os.path.join(patient_root, PATIENT_SUBDIR_PDFS)
-        os.makedirs(pdf_dir, exist_ok=True)
 
         date_str = normalize_mmddyyyy(self.exam_date_var.get()) or today_mmddyyyy()
         date_slug = safe_slug(date_str)
@@ -5789,7 +5986,7 @@ class App(tk.Tk):
         except Exception:
             pass
         try:
-            self.doc_vault_page.refresh_current_folder()
+            self._refresh_doc_vault()
         except Exception:
             pass
 
@@ -5804,9 +6001,8 @@ class App(tk.Tk):
             self.last_modalities_letter_pdf_paths[exam] = ""
             return ""
 
-        ensure_patient_dirs(patient_root)
+        self._ensure_patient_dirs(patient_root, PATIENT_SUBDIR_PDFS)
         pdf_dir = os.path.join(patient_root, PATIENT_SUBDIR_PDFS)
-        os.makedirs(pdf_dir, exist_ok=True)
         date_str = normalize_mmddyyyy(self.exam_date_var.get()) or today_mmddyyyy()
         date_slug = safe_slug(date_str)
         exam_slug = safe_slug(exam)
@@ -5840,9 +6036,8 @@ class App(tk.Tk):
             messagebox.showinfo("PDF", "Enter Last, First, DOB, and DOI first.")
             return
 
-        ensure_patient_dirs(patient_root)
+        self._ensure_patient_dirs(patient_root, PATIENT_SUBDIR_PDFS)
         pdf_dir = os.path.join(patient_root, PATIENT_SUBDIR_PDFS)
-        os.makedirs(pdf_dir, exist_ok=True)
 
         display = to_last_first(self.last_name_var.get(), self.first_name_var.get()) or "Patient"
         dob = (self.dob_var.get() or "").strip()
@@ -5853,9 +6048,24 @@ class App(tk.Tk):
         filename = f"{safe_slug(exam)}_{safe_slug(display)}_DOB_{safe_slug(dob)}_DOI_{safe_slug(doi)}.pdf"
         path = os.path.join(pdf_dir, filename)
 
+        # Payload is built here (Tk vars); only ReportLab rendering runs on the worker.
         payload = self.make_payload() or {}
-        build_combined_pdf(path, [payload])
 
+        def _done(_result, err):
+            if err is not None:
+                messagebox.showerror("Export Failed", f"Could not create the PDF:\n\n{err}")
+                return
+            self._finish_current_exam_pdf_export(path, payload)
+
+        self._run_with_busy_dialog(
+            "Export PDF",
+            f"Exporting {self.current_exam.get() or 'exam'} to PDF…",
+            lambda: build_combined_pdf(path, [payload]),
+            _done,
+        )
+
+    def _finish_current_exam_pdf_export(self, path: str, payload: dict) -> None:
+        """Vault copy, letter exports and settings once the exam PDF has been written."""
         # ✅ Auto-save/replace into Doc Vault -> pdfs/
         try:
             patient_root = self.get_current_patient_root()
@@ -5910,7 +6120,7 @@ class App(tk.Tk):
             print("Work status letter export failed:", e)
 
         try:
-            self.doc_vault_page.refresh_current_folder()
+            self._refresh_doc_vault()
         except Exception:
             pass
 
@@ -5972,25 +6182,41 @@ class App(tk.Tk):
             out.append(x)
         return out
 
+    # ---------- Coalesced UI passes ----------
+    def _schedule_apply(self, kind: str) -> None:
+        """Queue _apply_{header,demographics,exam_color} work ('header'|'demo'|'theme') for one idle pass."""
+        if not self._pending_apply:
+            self.after_idle(self._flush_apply)
+        self._pending_apply.add(kind)
+
+    def _flush_apply(self) -> None:
+        pending, self._pending_apply = self._pending_apply, set()
+        for kind, fn in (
+            ("header", self._apply_header_visibility),
+            ("demo", self._apply_demographics_visibility),
+            ("theme", self._apply_exam_color_theme),
+        ):
+            if kind in pending:
+                try:
+                    fn()
+                except Exception:
+                    pass
+
     # ---------- Color Theme ----------
     def _apply_exam_color_theme(self):
-        exam = self.current_exam.get()
-        theme = EXAM_COLORS.get(exam)
-        if not theme:
-            return
-
-        bg = theme["bg"]
-        accent = theme["accent"]
+        theme = exam_color_theme(self.current_exam.get() or "")
+        if theme:
+            bg = theme["bg"]
+            accent = theme["accent"]
+        else:
+            # Unthemed exam types (ROF, Chiro Visit): back to the stock frame colours.
+            bg, accent = self._exam_nav_default_colors
 
         self.exam_nav.configure(bg=bg)
         if hasattr(self, "exam_accent"):
             self.exam_accent.configure(bg=accent)
 
-        for name, btn in self.exam_buttons.items():
-            if name == exam:
-                btn.configure(style="ActiveExam.TButton")
-            else:
-                btn.configure(style="TButton")
+        self._refresh_exam_button_styles()
 
     # ---------- Mousewheel ----------
     def _set_mousewheel_target(self, widget: tk.Widget | None):
@@ -6302,9 +6528,12 @@ class App(tk.Tk):
         # --- Exam nav ---
         self.exam_nav = tk.Frame(left_root)
         self.exam_nav.pack(fill="x", padx=padx, pady=(6, 0))
+        self._exam_nav_default_colors = (self.exam_nav.cget("bg"), self.exam_accent.cget("bg"))
 
         ttk.Label(self.exam_nav, text="Exam:")#.pack(expand=True, anchor="center", padx=(0, 8))
         self.exam_buttons: dict[str, ttk.Button] = {}
+        # Exam whose button currently carries ActiveExam.TButton.
+        self._active_exam_name: str | None = None
 
         self.current_doc_label = ttk.Label(
             self.exam_nav,
@@ -6364,6 +6593,8 @@ class App(tk.Tk):
                 nav_pages.append("Docs")
 
         self.page_buttons: dict[str, ttk.Button] = {}
+        self._active_page_name: str | None = None
+        self._current_shown_page: str | None = None  # page last raised by show_page
         for page in nav_pages:
             b = ttk.Button(self.soap_nav, text=page, command=lambda p=page: self.show_page(p))
             b.pack(side="left", padx=4)
@@ -6429,7 +6660,7 @@ class App(tk.Tk):
         # call once after widget is created:
         apply_preview_styles(self.hoi_preview_text)        
         
-        self.hoi_page = HOIPage(self.content, self.schedule_autosave, app=self)
+        self.hoi_page = HOIPage(self.content, self._section_change_cb("hoi", self.schedule_autosave), app=self)
         self.after(50, self.request_live_preview_refresh)
 
         def _subjectives_on_change(*, regen_moi: bool = True):
@@ -6440,18 +6671,22 @@ class App(tk.Tk):
                         self.hoi_page._regen_moi_now()
                 except Exception:
                     pass
-        self.subjectives_page = SubjectivesPage(self.content, _subjectives_on_change, app=self)
+        self.subjectives_page = SubjectivesPage(
+            self.content, self._section_change_cb("subjectives", _subjectives_on_change), app=self
+        )
         self.family_social_page = FamilySocialHistoryPage(
             self.content,
             "Family/Social History",
-            self.schedule_autosave,
+            self._section_change_cb("family_social", self.schedule_autosave),
             app=self,
             clear_assoc_on_primary_clear=True,
         )
-        self.objectives_page = ObjectivesPage(self.content, self.schedule_autosave, app=self)
+        self.objectives_page = ObjectivesPage(
+            self.content, self._section_change_cb("objectives", self.schedule_autosave), app=self
+        )
         self.diagnosis_page = DiagnosisPage(
             self.content,
-            self.schedule_autosave,
+            self._section_change_cb("diagnosis", self.schedule_autosave),
             on_add_imaging_callback=self._on_imaging_recommendation_added,
             on_click_imaging_callback=self._on_imaging_recommendation_clicked,
             on_open_imaging_letter_callback=self._open_imaging_recommendation_letter_editor,
@@ -6467,7 +6702,7 @@ class App(tk.Tk):
             on_load_prior_dx_callback=self._get_prior_exam_dx_blocks,
         )
 
-        self.plan_page = PlanPage(self.content, on_change=self.schedule_autosave)
+        self.plan_page = PlanPage(self.content, on_change=self._section_change_cb("plan", self.schedule_autosave))
         self.plan_page.set_open_modalities_letter_editor_callback(self._open_modalities_recommendation_letter_editor)
 
         # ✅ Correct place — wire callback AFTER both exist
@@ -6475,18 +6710,12 @@ class App(tk.Tk):
             self.subjectives_page.clear_all_body_regions
         )
 
-        self.doc_vault_page = DocVaultPage(
-            self.content,
-            self.schedule_autosave,
-            get_patient_root_fn=self.get_current_patient_root,
-            list_item_style_fn=self._vault_list_item_meta,
-            sort_files_fn=self._sort_vault_imaging_files,
-        )
-
-        self.global_vault_page = GlobalVaultPage(
-            self.content,
-            on_change_callback=self.schedule_autosave,
-        )
+        # Vault pages are built on first show_page() (see _page_factories);
+        # nothing else needs their widgets until the user opens them.
+        self.doc_vault_page: DocVaultPage | None = None
+        self.global_vault_page: GlobalVaultPage | None = None
+        self._doc_vault_refresh_pending = False
+        self._global_vault_refresh_pending = False
 
         # --- Tk Docs timeline page ---
         self.tk_docs_page = TkDocsPage(
@@ -6515,13 +6744,47 @@ class App(tk.Tk):
             "Diagnosis": self.diagnosis_page,
             "Plan": self.plan_page,
             "Docs": self.tk_docs_page,
-            "Doc Vault": self.doc_vault_page,
-            "Global Vault": self.global_vault_page,
+        }
+        self._page_factories = {
+            "Doc Vault": self._build_doc_vault_page,
+            "Global Vault": self._build_global_vault_page,
         }
 
         for page in self.pages.values():
             page.grid(row=0, column=0, sticky="nsew")
 
+        # Section reset callables, resolved once (first API each page exposes).
+        self._page_resetters = {
+            key: fn
+            for key, fn in (
+                ("hoi", _resolve_page_resetter(self.hoi_page, [
+                    ("from_dict", ({},), {}),
+                    ("reset", (), {}),
+                ])),
+                # Whole-section reset: also wipe the Subjectives on Canvas area.
+                ("subjectives", _resolve_page_resetter(self.subjectives_page, [
+                    ("reset", (), {"include_canvas": True}),
+                    ("from_dict", ({"blocks": []},), {}),
+                ])),
+                ("family_social", _resolve_page_resetter(self.family_social_page, [
+                    ("reset", (), {}),
+                    ("set_value", ("",), {}),
+                ])),
+                ("objectives", _resolve_page_resetter(self.objectives_page, [
+                    ("from_dict", ({"global": {}, "blocks": []},), {}),
+                ])),
+                ("diagnosis", _resolve_page_resetter(self.diagnosis_page, [
+                    ("from_dict", ({},), {}),
+                    ("set_value", ("",), {}),
+                ])),
+                ("plan", _resolve_page_resetter(self.plan_page, [
+                    ("reset", (), {}),
+                    ("load_struct", ({"auto_enabled": True, "plan_text": ""},), {}),
+                ])),
+            )
+            if fn is not None
+        }
+
         self.tk_docs_page.refresh()
 
         # Now that Working Docs widgets exist, build the exam buttons into it
@@ -6543,21 +6806,6 @@ class App(tk.Tk):
             self.subjectives_page.scroll_frame.bind("<Enter>", lambda e: self._set_mousewheel_target(self.subjectives_page.canvas))
             self.subjectives_page.scroll_frame.bind("<Leave>", lambda e: self._set_mousewheel_target(None))
 
-        style = ttk.Style(self)
-        style.configure("ActiveExam.TButton", font=("Segoe UI", 10, "bold"))
-
-        style.configure(
-            "AddExam.TButton",
-            font=("Segoe UI", 10, "bold"),
-            padding=(10, 4)
-        )
-
-        style.map(
-            "AddExam.TButton",
-            foreground=[("!disabled", "#7a1f1f")],   # dark red text
-            background=[("active", "#f5c6c6")]
-        )
-
         # --- Bottom buttons ---
         bottom = ttk.Frame(self)
         bottom.pack(fill="x", padx=padx, pady=padx)
@@ -6584,15 +6832,9 @@ class App(tk.Tk):
 
         self._refresh_exam_button_styles()
         self._refresh_page_button_styles()
-        self._apply_exam_color_theme()
-        self._apply_header_visibility()
+        self._schedule_apply("theme")
+        self._schedule_apply("header")
 
-        for v in (
-            self.last_name_var, self.first_name_var,
-            self.dob_var, self.doi_var,
-            self.exam_date_var, self.claim_var, self.provider_var
-        ):
-            v.trace_add("write", self._refresh_demo_summary)        
 
         try:
             self._refresh_referral_toggle_buttons()
@@ -6601,15 +6843,67 @@ class App(tk.Tk):
 
     # ---------- Page switching ----------
 
+    def _build_doc_vault_page(self) -> DocVaultPage:
+        self.doc_vault_page = DocVaultPage(
+            self.content,
+            self.schedule_autosave,
+            get_patient_root_fn=self.get_current_patient_root,
+            list_item_style_fn=self._vault_list_item_meta,
+            sort_files_fn=self._sort_vault_imaging_files,
+            on_fs_change_fn=self._refresh_doc_vault,
+        )
+        return self.doc_vault_page
+
+    def _build_global_vault_page(self) -> GlobalVaultPage:
+        self.global_vault_page = GlobalVaultPage(
+            self.content,
+            on_change_callback=self.schedule_autosave,
+            on_fs_change_fn=self._refresh_global_vault,
+        )
+        return self.global_vault_page
+
+    def _refresh_doc_vault(self) -> None:
+        """Refresh the Doc Vault listing if the page has been built yet."""
+        if self.doc_vault_page is None:
+            return
+        if self._current_shown_page != "Doc Vault":
+            # Raised pages stay mapped, so check which one is up; relist when the vault is shown.
+            self._doc_vault_refresh_pending = True
+            return
+        self._doc_vault_refresh_pending = False
+        self.doc_vault_page.refresh_current_folder()
+
+    def _refresh_global_vault(self) -> None:
+        """Global Vault counterpart of _refresh_doc_vault (deferred while hidden)."""
+        if self.global_vault_page is None:
+            return
+        if self._current_shown_page != "Global Vault":
+            self._global_vault_refresh_pending = True
+            return
+        self._global_vault_refresh_pending = False
+        self.global_vault_page.refresh_current_folder()
+
     def show_page(self, page_name: str, *, scroll_live_preview: bool = True):
         if page_name not in self.pages:
-            return
+            factory = self._page_factories.pop(page_name, None)
+            if factory is None:
+                return
+            page = factory()
+            page.grid(row=0, column=0, sticky="nsew")
+            self.pages[page_name] = page
         if self.builder_compact_var.get():
             self.builder_compact_var.set(False)
             self._apply_builder_compact_visibility()
-        self.current_page.set(page_name)
-        self.pages[page_name].tkraise()
-        self._refresh_page_button_styles()
+        # Live Preview clicks re-show the page that is already up; skip the raise.
+        if self._current_shown_page != page_name:
+            self.current_page.set(page_name)
+            self.pages[page_name].tkraise()
+            self._current_shown_page = page_name
+            self._refresh_page_button_styles()
+            if page_name == "Doc Vault" and self._doc_vault_refresh_pending:
+                self._refresh_doc_vault()
+            elif page_name == "Global Vault" and self._global_vault_refresh_pending:
+                self._refresh_global_vault()
 
         if scroll_live_preview:
             self._center_preview_on_section(page_name)
@@ -6617,10 +6911,16 @@ class App(tk.Tk):
 
     def _refresh_page_button_styles(self):
         current = self.current_page.get()
-        for page, btn in self.page_buttons.items():
-            btn.state(["!disabled"])
-            if page == current:
-                btn.state(["disabled"])
+        prev = self._active_page_name
+        if prev == current:
+            return
+        old_btn = self.page_buttons.get(prev) if prev else None
+        if old_btn is not None:
+            old_btn.state(["!disabled"])
+        new_btn = self.page_buttons.get(current)
+        if new_btn is not None:
+            new_btn.state(["disabled"])
+        self._active_page_name = current if new_btn is not None else None
 
     
     def _prompt_new_exam_clear_dialog(self, target_exam: str) -> dict | None:
@@ -6629,14 +6929,48 @@ class App(tk.Tk):
         - dict of selections: {"hoi": bool, "subjectives": bool, "objectives": bool, "diagnosis": bool, "plan": bool}
         - {} means keep everything (clear nothing)
         - None means user cancelled (do not switch exams)
+
+        The Toplevel is built on first use and then withdrawn/re-shown, so later
+        calls only update the label and which checkboxes are visible.
         """
+        dlg = getattr(self, "_new_exam_dlg", None)
+        if dlg is None or not dlg.winfo_exists():
+            dlg = self._build_new_exam_clear_dialog()
+
+        parts = self._new_exam_dlg_parts
+        parts["label"].configure(
+            text=f"You're switching to a NEW exam: {target_exam}\n\n"
+                "Choose what to clear from the current on-screen exam.\n"
+                "Leave everything unchecked to KEEP everything and just tweak it."
+        )
+
+        # Default: keep everything (unchecked).
+        # Only show checkboxes for sections that actually have content (nice UX)
+        for key, cb in parts["checks"].items():
+            parts["vars"][key].set(False)
+            cb.pack_forget()
+            if self._section_has_content(key):
+                cb.pack(anchor="w", pady=2, before=parts["bottom_sep"])
+
+        parts["result"] = None
+        parts["done"].set(False)
+
+        dlg.deiconify()
+        # Center-ish
+        dlg.update_idletasks()
+        dlg.geometry(f"+{self.winfo_rootx()+120}+{self.winfo_rooty()+120}")
+        dlg.grab_set()
+
+        self.wait_variable(parts["done"])
+        return parts["result"]
+
+    def _build_new_exam_clear_dialog(self) -> tk.Toplevel:
         dlg = tk.Toplevel(self)
+        dlg.withdraw()
         dlg.title("Start New Exam")
         dlg.transient(self)
-        dlg.grab_set()
         dlg.resizable(False, False)
 
-        # Default: keep everything (unchecked)
         vars_map = {
             "hoi": tk.BooleanVar(value=False),
             "subjectives": tk.BooleanVar(value=False),
@@ -6644,51 +6978,57 @@ class App(tk.Tk):
             "diagnosis": tk.BooleanVar(value=False),
             "plan": tk.BooleanVar(value=False),
         }
+        labels = {
+            "hoi": "HOI",
+            "subjectives": "Subjectives",
+            "objectives": "Objectives",
+            "diagnosis": "Diagnosis",
+            "plan": "Plan",
+        }
 
         wrap = ttk.Frame(dlg, padding=14)
         wrap.pack(fill="both", expand=True)
 
-        ttk.Label(
-            wrap,
-            text=f"You're switching to a NEW exam: {target_exam}\n\n"
-                "Choose what to clear from the current on-screen exam.\n"
-                "Leave everything unchecked to KEEP everything and just tweak it.",
-            justify="left"
-        ).pack(anchor="w")
+        label = ttk.Label(wrap, justify="left")
+        label.pack(anchor="w")
 
         ttk.Separator(wrap).pack(fill="x", pady=10)
 
-        # Only show checkboxes for sections that actually have content (nice UX)
-        def add_cb(key: str, label: str, has_it: bool):
-            if not has_it:
-                return
-            ttk.Checkbutton(wrap, text=label, variable=vars_map[key]).pack(anchor="w", pady=2)
-
-        add_cb("hoi", "HOI", hasattr(self, "hoi_page") and self.hoi_page.has_content())
-        add_cb("subjectives", "Subjectives", hasattr(self, "subjectives_page") and self.subjectives_page.has_content())
-        add_cb("objectives", "Objectives", hasattr(self, "objectives_page") and self.objectives_page.has_content())
-        add_cb("diagnosis", "Diagnosis", hasattr(self, "diagnosis_page") and self.diagnosis_page.has_content())
-        add_cb("plan", "Plan", hasattr(self, "plan_page") and self.plan_page.has_content())
+        checks = {
+            key: ttk.Checkbutton(wrap, text=labels[key], variable=var)
+            for key, var in vars_map.items()
+        }
 
         # If nothing has content, no need to ask — but we still allow OK/cancel
-        ttk.Separator(wrap).pack(fill="x", pady=10)
+        bottom_sep = ttk.Separator(wrap)
+        bottom_sep.pack(fill="x", pady=10)
+
+        parts: dict = {
+            "label": label,
+            "vars": vars_map,
+            "checks": checks,
+            "bottom_sep": bottom_sep,
+            "done": tk.BooleanVar(value=False),
+            "result": None,
+        }
 
-        result: dict | None = {}
+        def finish(result: dict | None):
+            parts["result"] = result
+            try:
+                dlg.grab_release()
+            except Exception:
+                pass
+            dlg.withdraw()
+            parts["done"].set(True)
 
         def keep_all():
-            nonlocal result
-            result = {}  # keep everything
-            dlg.destroy()
+            finish({})  # keep everything
 
         def clear_selected():
-            nonlocal result
-            result = {k: v.get() for k, v in vars_map.items()}
-            dlg.destroy()
+            finish({k: v.get() for k, v in vars_map.items()})
 
         def cancel():
-            nonlocal result
-            result = None
-            dlg.destroy()
+            finish(None)
 
         btns = ttk.Frame(wrap)
         btns.pack(fill="x", pady=(4, 0))
@@ -6697,86 +7037,74 @@ class App(tk.Tk):
         ttk.Button(btns, text="Clear Selected", command=clear_selected).pack(side="right", padx=(6, 0))
         ttk.Button(btns, text="Keep Everything", command=keep_all).pack(side="right")
 
-        # Center-ish
-        dlg.update_idletasks()
-        dlg.geometry(f"+{self.winfo_rootx()+120}+{self.winfo_rooty()+120}")
+        # Closing the window keeps everything, same as the old destroy-on-close.
+        dlg.protocol("WM_DELETE_WINDOW", keep_all)
 
-        self.wait_window(dlg)
-        return result
+        self._new_exam_dlg = dlg
+        self._new_exam_dlg_parts = parts
+        return dlg
 
     def _new_exam_auto_clear_selection(self) -> dict:
         """Sections with on-screen content to clear when opening an unsaved exam."""
-        sel: dict = {}
-        if hasattr(self, "hoi_page") and self.hoi_page.has_content():
-            sel["hoi"] = True
-        if hasattr(self, "subjectives_page") and self.subjectives_page.has_content():
-            sel["subjectives"] = True
-        if hasattr(self, "objectives_page") and self.objectives_page.has_content():
-            sel["objectives"] = True
-        if hasattr(self, "diagnosis_page") and self.diagnosis_page.has_content():
-            sel["diagnosis"] = True
-        if hasattr(self, "plan_page") and self.plan_page.has_content():
-            sel["plan"] = True
-        return sel
+        return {
+            key: True
+            for key in ("hoi", "subjectives", "objectives", "diagnosis", "plan")
+            if self._section_has_content(key)
+        }
 
-    def _clear_sections_silent(self, sel: dict):
-        # HOI
-        if sel.get("hoi"):            
-            try:
-                self.hoi_page.from_dict({})
-            except Exception:
-                try:
-                    self.hoi_page.reset()
-                except Exception:
-                    pass
+    # ---------- Section content tracking ----------
 
-        # Subjectives
-        if sel.get("subjectives"):
-            try:
-                # Whole-section reset: also wipe the Subjectives on Canvas area.
-                self.subjectives_page.reset(include_canvas=True)
-            except TypeError:
-                # Older signature without keyword
-                try:
-                    self.subjectives_page.reset()
-                except Exception:
-                    try:
-                        self.subjectives_page.from_dict({"blocks": []})
-                    except Exception:
-                        pass
-            except Exception:
-                try:
-                # fallback
-                    self.subjectives_page.from_dict({"blocks": []})
-                except Exception:
-                    pass
+    # Page attribute prefix (``<name>_page``) for every SOAP section.
+    _CONTENT_SECTIONS = ("hoi", "subjectives", "family_social", "objectives", "diagnosis", "plan")
 
-        # Objectives
-        if sel.get("objectives"):
-            try:
-                self.objectives_page.from_dict({"global": {}, "blocks": []})
-            except Exception:
-                pass
+    def _section_change_cb(self, name: str, on_change):
+        """Wrap a page's change callback so it also forgets the section's cached content answer."""
+        def _cb(*args, **kwargs):
+            self._mark_section_dirty(name)
+            return on_change(*args, **kwargs)
+        return _cb
 
-        # Diagnosis
-        if sel.get("diagnosis"):
-            try:
-                self.diagnosis_page.from_dict({})
-            except Exception:
-                try:
-                    self.diagnosis_page.set_value("")
-                except Exception:
-                    pass
+    def _mark_section_dirty(self, name: str) -> None:
+        # Drop, don't set True: pages also notify on from_dict()/reset() (some a
+        # beat later, e.g. notes boxes' <<Modified>>), and an emptied section must
+        # read as empty again. The next _section_has_content() re-asks the page.
+        self._has_content_cache.pop(name, None)
+
+    def _section_has_content(self, name: str) -> bool:
+        """
+        Cached ``<name>_page.has_content()``.
 
-        # Plan
-        if sel.get("plan"):
+        Only a positive answer is cached (set by a successful check and dropped
+        by the page's change callback); otherwise the page is asked again. A stale True just
+        saves/clears an empty section, whereas a stale False could skip an
+        autosave, so the cache never holds False.
+        """
+        if self._has_content_cache.get(name):
+            return True
+        page = getattr(self, f"{name}_page", None)
+        if page is None:
+            return False
+        try:
+            has_it = bool(page.has_content())
+        except Exception:
+            return False
+        if has_it:
+            self._has_content_cache[name] = True
+        return has_it
+
+    def _clear_sections_silent(self, sel: dict):
+        for key, wanted in sel.items():
+            if not wanted:
+                continue
+            self._has_content_cache.pop(key, None)
+            reset = self._page_resetters.get(key)
+            if reset is None:
+                continue
             try:
-                self.plan_page.reset()
+                reset()
             except Exception:
-                try:
-                    self.plan_page.load_struct({"auto_enabled": True, "plan_text": ""})
-                except Exception:
-                    pass
+                pass
+            self._has_content_cache.pop(key, None)
 
 
     def switch_exam(self, exam_name: str, force: bool = False):
@@ -6789,7 +7117,7 @@ class App(tk.Tk):
         self.current_exam.set(exam_name)
 
         self._set_current_doc_label()
-        self._apply_exam_color_theme()
+        self._schedule_apply("theme")
         self._refresh_exam_button_styles()
         
 
@@ -6814,21 +7142,24 @@ class App(tk.Tk):
 
 
     def _refresh_exam_button_styles(self):
+        # Only the previously active and newly active buttons change style.
         current = self.current_exam.get()
-        for exam, btn in self.exam_buttons.items():
-            btn.state(["!disabled"])
-            if exam == current:
-                btn.configure(style="ActiveExam.TButton")
-            else:
-                btn.configure(style="TButton")
+        prev = self._active_exam_name
+        if prev == current:
+            return
+        old_btn = self.exam_buttons.get(prev) if prev else None
+        if old_btn is not None:
+            old_btn.configure(style="TButton")
+        new_btn = self.exam_buttons.get(current)
+        if new_btn is not None:
+            new_btn.configure(style="ActiveExam.TButton")
+        self._active_exam_name = current if new_btn is not None else None
     
     def _exam_index_path_for_root(self, patient_root: str | None) -> str | None:
         if not patient_root:
             return None
-        ensure_patient_dirs(patient_root)
-        index_dir = os.path.join(patient_root, EXAM_INDEX_SUBDIR)
-        os.makedirs(index_dir, exist_ok=True)
-        return os.path.join(index_dir, EXAM_INDEX_FILENAME)
+        self._ensure_patient_dirs(patient_root, EXAM_INDEX_SUBDIR)
+        return os.path.join(patient_root, EXAM_INDEX_SUBDIR, EXAM_INDEX_FILENAME)
 
     def _exam_index_path(self) -> str | None:
         return self._exam_index_path_for_root(self.get_current_patient_root())
@@ -6842,10 +7173,9 @@ class App(tk.Tk):
         if not patient_root:
             return list(EMPTY_EXAMS)
 
-        ensure_patient_dirs(patient_root)
+        self._ensure_patient_dirs(patient_root, EXAM_INDEX_SUBDIR)
         exams_dir = os.path.join(patient_root, PATIENT_SUBDIR_EXAMS)
         index_dir = os.path.join(patient_root, EXAM_INDEX_SUBDIR)
-        os.makedirs(index_dir, exist_ok=True)
 
         primary_path = os.path.join(index_dir, EXAM_INDEX_FILENAME)
         legacy_path = os.path.join(exams_dir, EXAM_INDEX_FILENAME)
@@ -6931,7 +7261,7 @@ class App(tk.Tk):
         # Ensure dynamic exam list is up to date for this patient
         try:
             if self.get_current_patient_root():
-                self.exams = self._load_dynamic_exams_for_patient()
+                self._set_exams(self._load_dynamic_exams_for_patient())
         except Exception as e:
             print(f"Could not load dynamic exams for patient: {e}")
             return
@@ -6944,14 +7274,18 @@ class App(tk.Tk):
             "final": 0,
         }
 
+        patient_root = self.get_current_patient_root()
+        saved_files = self._saved_exam_filenames(patient_root) if patient_root else set()
+        exam_paths = self._exam_paths(patient_root) if patient_root else {}
+
         for exam in (self.exams or []):
             exam_type = self._classify_exam_type(exam)
             if not exam_type:
                 continue  # skip unknown types
 
             # Only count exams that actually have a saved JSON file
-            path = self.compute_exam_path(exam)
-            if not path or not os.path.exists(path):
+            path = exam_paths.get(exam)
+            if not path or os.path.basename(path) not in saved_files:
                 continue
 
             counts[exam_type] = counts.get(exam_type, 0) + 1
@@ -6973,7 +7307,7 @@ class App(tk.Tk):
             return
         try:
             with open(p, "w", encoding="utf-8") as f:
-                json.dump({"exams": list(self.exams)}, f, indent=2)
+                f.write(_json_dumps_indent2({"exams": list(self.exams)}))
         except Exception:
             pass
 
@@ -7500,7 +7834,7 @@ class App(tk.Tk):
             self.modalities_letter_text_overrides = {e: "" for e in exams_list}
             self.modalities_letter_staff_signatures = {e: "" for e in exams_list}
             self._set_current_doc_label()
-            self._apply_exam_color_theme()
+            self._schedule_apply("theme")
             self._refresh_exam_button_styles()
             try:
                 self.tk_docs_page.refresh()
@@ -7553,7 +7887,7 @@ class App(tk.Tk):
             cleanup_grab()
             dlg.destroy()
             self._apply_demographics_from_patient_folder(folder)
-            self.exams = self._load_dynamic_exams_for_patient_root(str(folder))
+            self._set_exams(self._load_dynamic_exams_for_patient_root(str(folder)))
             self._rebuild_exam_nav_buttons()
             try:
                 self.load_case_from_path(path)
@@ -7593,7 +7927,7 @@ class App(tk.Tk):
 
         if len(visits) == 1:
             self._apply_demographics_from_patient_folder(folder)
-            self.exams = self._load_dynamic_exams_for_patient_root(patient_root)
+            self._set_exams(self._load_dynamic_exams_for_patient_root(patient_root))
             self._rebuild_exam_nav_buttons()
             try:
                 self.load_case_from_path(visits[0][2])
@@ -7607,34 +7941,74 @@ class App(tk.Tk):
             return
 
         self._apply_demographics_from_patient_folder(folder)
-        self.exams = self._load_dynamic_exams_for_patient_root(patient_root)
+        self._set_exams(self._load_dynamic_exams_for_patient_root(patient_root))
         self._rebuild_exam_nav_buttons()
         self._finish_patient_switch_no_saved_visits()
 
     # ---------- Settings ----------
 
     def write_settings(self, settings: dict):
-        ensure_year_root()
-        base: dict = {}
-        if SETTINGS_PATH.exists():
+        """
+        Merge ``settings`` into the in-memory settings and schedule one disk write.
+
+        Bursts of calls (autosave, exports, letter editors) collapse into a single
+        flush one autosave debounce later; flush_settings_now() forces it.
+        """
+        self._load_settings_cache().update(settings)
+        self._settings_pending.update(settings)
+        if self._settings_flush_after_id is None:
+            self._settings_flush_after_id = self.after(AUTOSAVE_DEBOUNCE_MS, self._flush_settings)
+
+    def flush_settings_now(self) -> None:
+        """Write any pending settings immediately instead of waiting for the debounce."""
+        if self._settings_flush_after_id is not None:
             try:
-                with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                    base = json.load(f) or {}
+                self.after_cancel(self._settings_flush_after_id)
             except Exception:
-                base = {}
-        base.update(settings)
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(base, f, indent=2)
+                pass
+        self._flush_settings()
 
-    def read_settings(self) -> dict:
+    def _flush_settings(self) -> None:
+        self._settings_flush_after_id = None
+        if not self._settings_pending:
+            return
+        pending, self._settings_pending = self._settings_pending, {}
+
+        ensure_year_root()
+        # Re-read the file so keys written by other windows/processes
+        # (e.g. the attorney DOL referral log) are preserved.
+        disk = self._read_settings_file()
+        merged = {**disk, **pending}
+        self._settings_cache = merged
+        if merged == disk:
+            return
+        try:
+            # Atomic: a crash mid-write must not leave a truncated settings file.
+            _write_bytes_atomic(Path(SETTINGS_PATH), _json_dumps_indent2(merged).encode("utf-8"))
+        except Exception as e:
+            # Keep the keys queued so the next write_settings retries them.
+            self._settings_pending = {**pending, **self._settings_pending}
+            print("Settings write failed:", e)
+
+    def _read_settings_file(self) -> dict:
         if not SETTINGS_PATH.exists():
             return {}
 
         try:
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                return json.load(f) or {}
+            with open(SETTINGS_PATH, "rb") as f:
+                data = _json_loads(f.read()) or {}
         except Exception:
             return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load_settings_cache(self) -> dict:
+        if self._settings_cache is None:
+            self._settings_cache = self._read_settings_file()
+        return self._settings_cache
+
+    def read_settings(self) -> dict:
+        # Copy so callers can't mutate the cache behind write_settings' back.
+        return dict(self._load_settings_cache())
 
     # ---------- Patient folders / paths ----------    
     def _ensure_current_patient_id(self) -> str:
@@ -7649,12 +8023,36 @@ class App(tk.Tk):
         pid = getattr(self, "current_patient_id", None)
         if not pid:
             return None
-        folder = get_patient_root(
-            pid,
-            self.last_name_var.get() or "",
-            self.first_name_var.get() or "",
-        )
-        return str(folder)
+        # The folder name depends only on (pid, last, first). Resolving it scans
+        # id_cases and may rename the folder, so reuse the last answer while the
+        # key is unchanged and the folder is still there.
+        key = (pid, self.last_name_var.get() or "", self.first_name_var.get() or "")
+        cached = self._patient_root_cache
+        if cached is not None and cached[0] == key and os.path.isdir(cached[1]):
+            return cached[1]
+
+        folder = str(get_patient_root(pid, key[1], key[2]))
+        self._patient_root_cache = (key, folder)
+        # New patient key (or the folder moved): re-check its subfolders.
+        self._dirs_ensured.clear()
+        return folder
+
+    def _clear_patient_path_caches(self) -> None:
+        """Drop memoized patient folder / exam paths (new case; entries are per folder anyway)."""
+        self._patient_root_cache = None
+        self._exam_path_cache.clear()
+        self._dirs_ensured.clear()
+
+    def _ensure_patient_dirs(self, patient_root: str, *subdirs: str) -> None:
+        """ensure_patient_dirs() + extra subfolders, at most once per folder this session."""
+        if patient_root not in self._dirs_ensured:
+            ensure_patient_dirs(patient_root)
+            self._dirs_ensured.add(patient_root)
+        for sub in subdirs:
+            d = os.path.join(patient_root, sub)
+            if d not in self._dirs_ensured:
+                os.makedirs(d, exist_ok=True)
+                self._dirs_ensured.add(d)
 
 
     def compute_exam_path(self, exam_name: str | None = None) -> str | None:
@@ -7664,9 +8062,32 @@ class App(tk.Tk):
         if not patient_root:
             return None
 
-        ensure_patient_dirs(patient_root)
-        filename = f"{safe_slug(exam_name)}.json"
-        return os.path.join(patient_root, PATIENT_SUBDIR_EXAMS, filename)
+        # Subfolders only need creating once per patient folder, not per autosave.
+        self._ensure_patient_dirs(patient_root)
+        return self._exam_path_in(patient_root, exam_name)
+
+    def _exam_path_in(self, patient_root: str, exam_name: str) -> str:
+        key = (patient_root, exam_name)
+        path = self._exam_path_cache.get(key)
+        if path is None:
+            filename = f"{safe_slug(exam_name)}.json"
+            path = os.path.join(patient_root, PATIENT_SUBDIR_EXAMS, filename)
+            self._exam_path_cache[key] = path
+        return path
+
+    def _exam_paths(self, patient_root: str) -> dict[str, str]:
+        """{exam: JSON path} for every exam in self.exams, resolving the patient folder only once."""
+        self._ensure_patient_dirs(patient_root)
+        return {exam: self._exam_path_in(patient_root, exam) for exam in self.exams}
+
+    def _saved_exam_filenames(self, patient_root: str) -> set[str]:
+        """Names of the exam JSON files in the patient's exams folder (one directory scan)."""
+        exams_dir = os.path.join(patient_root, PATIENT_SUBDIR_EXAMS)
+        try:
+            with os.scandir(exams_dir) as it:
+                return {e.name for e in it if e.is_file()}
+        except OSError:
+            return set()
 
     def _load_global_letter_preferences(self, settings: dict | None = None) -> None:
         """
@@ -8065,7 +8486,7 @@ class App(tk.Tk):
                     self._loading = True
                     try:
                         self._apply_demographics_from_patient_folder(folder)
-                        self.exams = self._load_dynamic_exams_for_patient_root(str(folder))
+                        self._set_exams(self._load_dynamic_exams_for_patient_root(str(folder)))
                     finally:
                         self._loading = False
                     self._rebuild_exam_nav_buttons()
@@ -8106,7 +8527,7 @@ class App(tk.Tk):
 
         if getattr(self, "_start_blank", False):
             self.status_var.set("Ready. (New blank form)")
-            self._apply_exam_color_theme()
+            self._schedule_apply("theme")
             return
 
         settings = self.read_settings()
@@ -8131,14 +8552,14 @@ class App(tk.Tk):
 
         # keep this AFTER load/rebuild
         last_exam = (settings.get("last_exam") or "").strip()
-        if last_exam and last_exam.lower() in {e.lower() for e in self.exams}:
+        if last_exam and last_exam.lower() in self.exams_lc:
             self.current_exam.set(last_exam)
             self._refresh_exam_button_styles()
 
         pdf_map = settings.get("last_exam_pdfs", {})
         if isinstance(pdf_map, dict):
             if not hasattr(self, "exams") or not self.exams:
-                self.exams = list(EMPTY_EXAMS)
+                self._set_exams(list(EMPTY_EXAMS))
 
             for exam in self.exams:
                 self.last_exam_pdf_paths[exam] = pdf_map.get(exam, "") or ""
@@ -8146,7 +8567,7 @@ class App(tk.Tk):
         img_map = settings.get("last_imaging_letter_pdfs", {})
         if isinstance(img_map, dict):
             if not hasattr(self, "exams") or not self.exams:
-                self.exams = list(EMPTY_EXAMS)
+                self._set_exams(list(EMPTY_EXAMS))
             if not hasattr(self, "last_imaging_letter_pdf_paths") or not isinstance(self.last_imaging_letter_pdf_paths, dict):
                 self.last_imaging_letter_pdf_paths = {}
             for exam in self.exams:
@@ -8217,16 +8638,35 @@ class App(tk.Tk):
                         pass
 
         self.last_all_exams_pdf_path = settings.get("last_all_exams_pdf", "") or ""
-        self._apply_exam_color_theme()
+        self._schedule_apply("theme")
 
 
     def _wire_autosave_triggers(self):
+        self._demo_refresh_pending = False
+        self._demo_autosave_pending = False
         for v in (
             self.last_name_var, self.first_name_var,
             self.dob_var, self.doi_var, self.exam_date_var,
             self.claim_var, self.provider_var
         ):
-            v.trace_add("write", lambda *_: self.schedule_autosave())
+            v.trace_add("write", self._on_demo_var_changed)
+
+    def _on_demo_var_changed(self, *_):
+        """One trace for the demographics vars: summary refresh + autosave, coalesced per idle cycle."""
+        # Decide now: by the time the idle callback runs, a load may have finished.
+        if not self._loading:
+            self._demo_autosave_pending = True
+        if self._demo_refresh_pending:
+            return
+        self._demo_refresh_pending = True
+        self.after_idle(self._do_demo_refresh)
+
+    def _do_demo_refresh(self):
+        self._demo_refresh_pending = False
+        self._refresh_demo_summary()
+        if self._demo_autosave_pending:
+            self._demo_autosave_pending = False
+            self.schedule_autosave()
 
     def schedule_autosave(self):
         if self._loading:
@@ -8245,19 +8685,7 @@ class App(tk.Tk):
         
 
     def _current_exam_has_content(self) -> bool:
-        if hasattr(self, "hoi_page") and self.hoi_page.has_content():
-            return True
-        if self.subjectives_page.has_content():
-            return True
-        if hasattr(self, "family_social_page") and self.family_social_page.has_content():
-            return True
-        if self.objectives_page.has_content():
-            return True
-        if self.diagnosis_page.has_content():
-            return True
-        if self.plan_page.has_content():
-            return True
-        return False
+        return any(self._section_has_content(name) for name in self._CONTENT_SECTIONS)
 
 
     def _autosave(self, force: bool = False):
@@ -8275,9 +8703,12 @@ class App(tk.Tk):
             self.status_var.set(f"Not auto-saving ({self.current_exam.get()}): no content yet.")
             return
 
+        # Debounced ticks write in the background; forced saves (exam switch,
+        # export, exit) must be on disk before the caller moves on.
         try:
-            self.save_case_to_path(path)
-            self.status_var.set(f"Auto-saved ({self.current_exam.get()}): {os.path.basename(path)}")
+            self.save_case_to_path(path, background=not force)
+            if force:
+                self.status_var.set(f"Auto-saved ({self.current_exam.get()}): {os.path.basename(path)}")
         except Exception as e:
             self.status_var.set(f"Auto-save failed: {e}")
 
@@ -8285,6 +8716,8 @@ class App(tk.Tk):
     def _apply_soap_to_ui(self, soap: dict):
         """Apply a soap dict to all SOAP pages (HOI, Subjectives, Objectives, Diagnosis, Plan, Family/Social). Does not change patient demographics."""
         soap = soap or {}
+        # Every page is reloaded, so forget what we knew about their content.
+        self._has_content_cache.clear()
         self.hoi_page.from_dict(soap.get("hoi_struct") or {})
         self.subjectives_page.from_dict(soap.get("subjectives") or {})
         try:
@@ -8329,6 +8762,8 @@ class App(tk.Tk):
                 self.hoi_page._regen_moi_now()
         except Exception:
             pass
+        # Anything cached while the pages were loading describes the old exam.
+        self._has_content_cache.clear()
 
     def _load_soap_dict_from_saved_exam(self, exam_name: str) -> dict | None:
         """Load soap dict from disk for a named exam, or None if missing/unreadable."""
@@ -8813,23 +9248,6 @@ class App(tk.Tk):
         self._ref_btn_text: dict[str, tk.StringVar] = {}
         self._ref_buttons: dict[str, ttk.Button] = {}
 
-        style = ttk.Style(self)
-        style.configure(
-            "Ref.Inactive.TButton",
-            font=("Segoe UI", 9),
-            padding=(6, 3),
-        )
-        style.configure(
-            "Ref.Active.TButton",
-            font=("Segoe UI", 9, "bold"),
-            padding=(6, 3),
-        )
-        style.map(
-            "Ref.Active.TButton",
-            foreground=[("!disabled", "#0a4d0a")],
-            background=[("active", "#cfe9cf")],
-        )
-
         for direction, label in (
             ("from_dol", "Doctors on Liens"),
             ("from_attorney", "Attorney Referred Patient"),
@@ -8954,8 +9372,7 @@ class App(tk.Tk):
         if not patient_root:
             return
 
-        from utils import ensure_patient_dirs
-        ensure_patient_dirs(patient_root)
+        self._ensure_patient_dirs(patient_root)
 
         state = adata.load_patient_referral_state(patient_root)
         current_aid = (state.get(direction, {}) or {}).get("attorney_id") or ""
@@ -9149,7 +9566,6 @@ class App(tk.Tk):
             hoi_struct = {}
 
         obj_text = ""
-        obj_struct = {"global": {}, "blocks": []}
 
         try:
             obj_text = self.objectives_page.get_value() or ""
@@ -9161,18 +9577,7 @@ class App(tk.Tk):
         except Exception:
             raw = {}
 
-        if isinstance(raw, dict):
-            g = raw.get("global")
-            if g is None:
-                g = raw.get("globals")
-            obj_struct["global"] = g if isinstance(g, dict) else {}
-            b = raw.get("blocks")
-            obj_struct["blocks"] = b if isinstance(b, list) else []
-            canv = raw.get("canvas")
-            if isinstance(canv, dict):
-                obj_struct["canvas"] = canv
-        else:
-            obj_struct = {"global": {}, "blocks": []}
+        obj_struct = _normalize_objectives_struct(raw)
 
         fs_builder: dict = {"v": BUILDER_STATE_VERSION, "blocks": []}
         try:
@@ -9222,18 +9627,188 @@ class App(tk.Tk):
         return payload      
     
 
-    def save_case_to_path(self, path: str | Path):
+    def _serialize_payload(self, payload: dict) -> tuple[str, bytes]:
+        """
+        Serialize an exam payload, reusing cached JSON for unchanged SOAP sections.
+
+        A section is reused only when its value still strictly matches
+        (_json_same) the snapshot decoded from the cached text, so edits that bypass the page change callbacks
+        (template loads, cross-page regeneration) can never persist stale data.
+        Layout matches json.dumps(payload, indent=2).
+
+        Returns ``(text, digest)``; the digest covers everything except the
+        ``saved_at`` timestamp so identical content hashes the same.
+        """
+        soap = payload.get("soap")
+        if not isinstance(soap, dict):
+            content = {k: v for k, v in payload.items() if k != "saved_at"}
+            digest = hashlib.blake2b(_json_dumps_indent2(content).encode("utf-8"), digest_size=16).digest()
+            return _json_dumps_indent2(payload), digest
+
+        soap_members: list[tuple[str, str]] = []
+        for key, value in soap.items():
+            cached = self._soap_fragment_cache.get(key)
+            if cached is not None and _json_same(value, cached[0]):
+                frag = cached[1]
+            else:
+                frag = _json_fragment(value, 2)
+                self._soap_fragment_cache[key] = (_json_loads(frag), frag)
+            soap_members.append((key, frag))
+
+        members = [
+            (k, _json_object_from_fragments(soap_members, 1) if k == "soap" else _json_fragment(v, 1))
+            for k, v in payload.items()
+        ]
+
+        h = hashlib.blake2b(digest_size=16)
+        for k, frag in members:
+            if k != "saved_at":
+                h.update(k.encode("utf-8"))
+                h.update(frag.encode("utf-8"))
+        return _json_object_from_fragments(members), h.digest()
+
+    def _saved_digest_matches(self, path: Path, digest: bytes) -> bool:
+        """True when ``path`` still holds exactly what we last wrote with this content digest."""
+        rec = self._saved_digests.get(str(path))
+        if rec is None or rec[0] != digest:
+            return False
+        try:
+            # Any other writer (another exam's demographics propagation, the
+            # shell, a restore) bumps the mtime and forces a real write.
+            return os.stat(path).st_mtime_ns == rec[1]
+        except OSError:
+            return False
+
+    def _record_saved_digest(self, path: Path, digest: bytes, token: int) -> None:
+        # Only the most recently issued write for a path may vouch for its contents.
+        if self._save_tokens.get(str(path)) != token:
+            return
+        try:
+            self._saved_digests[str(path)] = (digest, os.stat(path).st_mtime_ns)
+        except OSError:
+            self._saved_digests.pop(str(path), None)
+
+    def save_case_to_path(self, path: str | Path, *, background: bool = False):
+        """
+        Save the current exam JSON to ``path``.
+
+        The payload is always built and serialized here on the Tk thread (Tk vars
+        are not thread-safe); only the file write goes to the save worker.
+        With ``background=True`` this returns immediately and the post-save
+        bookkeeping runs from _on_background_save_done; otherwise it blocks
+        until the write lands (and raises on failure), as explicit saves expect.
+        """
         path = Path(path)
+
+        if background and self._save_in_flight:
+            # A write is still running: save once more when it finishes so the
+            # newest edits are captured without queueing a backlog of writes.
+            self._save_pending = True
+            return
+
         payload = self.make_payload()
 
-        _find_sets(payload)
+        text, digest = self._serialize_payload(payload)
 
-        tmp_path = path.with_suffix(path.suffix + ".tmp")
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        if self._saved_digest_matches(path, digest):
+            # Same content as the file already on disk: skip the write + fsync.
+            if not background:
+                self._after_case_saved(path)
+            return
+
+        data = text.encode("utf-8")
+        self._save_token_seq += 1
+        token = self._save_token_seq
+        self._save_tokens[str(path)] = token
 
-        os.replace(tmp_path, path)
+        if not background:
+            # Routed through the same single worker so it can never race an
+            # in-flight background write of the same file. That write is
+            # finished here first; this save supersedes any queued follow-up.
+            self._save_pending = False
+            self._finish_background_save(wait=True)
+            self._save_executor.submit(_write_bytes_atomic, path, data).result()
+            self._after_case_saved(path)
+            self._record_saved_digest(path, digest, token)
+            return
 
+        exam = self.current_exam.get()
+        self._save_in_flight = True
+        fut = self._save_executor.submit(_write_bytes_atomic, path, data)
+        self._bg_save = (fut, path, exam, digest, token)
+        self._bg_save_after_id = self.after(50, self._poll_background_save)
+
+    def _poll_background_save(self) -> None:
+        self._bg_save_after_id = None
+        if self._bg_save is None:
+            return
+        if not self._bg_save[0].done():
+            self._bg_save_after_id = self.after(50, self._poll_background_save)
+            return
+        self._finish_background_save()
+
+    def _finish_background_save(self, wait: bool = False) -> None:
+        """Run the Tk-side completion of the background write (blocking on it if ``wait``)."""
+        if self._bg_save is None:
+            return
+        fut, path, exam, digest, token = self._bg_save
+        if not wait and not fut.done():
+            return
+        self._bg_save = None
+        if self._bg_save_after_id is not None:
+            try:
+                self.after_cancel(self._bg_save_after_id)
+            except Exception:
+                pass
+            self._bg_save_after_id = None
+        wait_futures([fut])
+        self._on_background_save_done(path, exam, fut, digest, token)
+
+    def _on_background_save_done(
+        self, path: Path, exam: str, fut: Future, digest: bytes, token: int
+    ) -> None:
+        """Tk-thread completion for a background save started by _autosave."""
+        self._save_in_flight = False
+
+        err = fut.exception()
+        if err is not None:
+            self.status_var.set(f"Auto-save failed: {err}")
+        elif exam == self.current_exam.get():
+            # If the user switched exams meanwhile, switch_exam's forced save
+            # already did this bookkeeping for the exam that was written.
+            try:
+                self._after_case_saved(path)
+                self._record_saved_digest(path, digest, token)
+                self.status_var.set(f"Auto-saved ({exam}): {path.name}")
+            except Exception as e:
+                self.status_var.set(f"Auto-save failed: {e}")
+
+        if self._save_pending:
+            self._save_pending = False
+            self._autosave()
+
+    def destroy(self):
+        # Finish the in-flight autosave here on the Tk thread (no follow-up save),
+        # then let any queued exam write / PDF render finish before the interpreter tears down.
+        self._save_pending = False
+        try:
+            self._finish_background_save(wait=True)
+        except Exception:
+            pass
+        for executor in (self._save_executor, self._pdf_executor):
+            try:
+                executor.shutdown(wait=True)
+            except Exception:
+                pass
+        # Persist settings still waiting on the debounce timer.
+        try:
+            self.flush_settings_now()
+        except Exception:
+            pass
+        super().destroy()
+
+    def _after_case_saved(self, path: Path) -> None:
+        """Settings, demographics propagation and billing sync once an exam JSON is on disk."""
         self.current_case_path = str(path)
         self.write_settings({
             "last_case_path": str(path),
@@ -9308,14 +9883,14 @@ class App(tk.Tk):
     def load_case_from_path(self, path: str):
         self._loading = True
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            with open(path, "rb") as f:
+                payload = _json_loads(f.read())
 
             file_exam = (payload.get("exam") or "").strip()
             if file_exam:
                 # If this exam isn't in the dynamic list yet, add it and rebuild tabs
-                if file_exam.lower() not in {e.lower() for e in self.exams}:
-                    self.exams.append(file_exam)
+                if file_exam.lower() not in self.exams_lc:
+                    self._set_exams([*self.exams, file_exam])
                     self._save_dynamic_exams_for_patient()
                     self._rebuild_exam_nav_buttons()
 
@@ -9374,7 +9949,7 @@ class App(tk.Tk):
 
             self._rebuild_exam_nav_buttons()
 
-            self._apply_exam_color_theme()
+            self._schedule_apply("theme")
 
             self._set_current_doc_label()
 
@@ -9405,17 +9980,9 @@ class App(tk.Tk):
             "objectives": True,
             "diagnosis": True,
             "plan": True,
+            "family_social": True,
         })
 
-        try:
-            self.family_social_page.reset()
-        except Exception:
-            try:
-                self.family_social_page.set_value("")
-            except Exception:
-                pass
-
-        
 
     def reset_current_exam(self):
         if not messagebox.askyesno("Reset Exam", f"Clear ONLY the current exam ({self.current_exam.get()})?"):
@@ -9475,7 +10042,7 @@ class App(tk.Tk):
         patient_root = self.get_current_patient_root()
         initialdir = str(YEAR_CASES_ROOT)
         if patient_root:
-            ensure_patient_dirs(patient_root)
+            self._ensure_patient_dirs(patient_root)
             initialdir = os.path.join(patient_root, PATIENT_SUBDIR_PDFS)
 
         display = to_last_first(self.last_name_var.get(), self.first_name_var.get()) or "Patient"
@@ -9548,7 +10115,7 @@ class App(tk.Tk):
             print("Imaging / referral / work status letter export failed:", e)
 
         try:
-            self.doc_vault_page.refresh_current_folder()
+            self._refresh_doc_vault()
         except Exception:
             pass
 
@@ -9573,6 +10140,49 @@ class App(tk.Tk):
         })
         messagebox.showinfo("Success", f"PDF saved:\n{path}")
 
+    def _run_with_busy_dialog(self, title: str, message: str, work, on_done) -> None:
+        """
+        Run ``work()`` on the PDF worker behind a small modal window with an
+        indeterminate progress bar, keeping the Tk loop responsive meanwhile.
+        ``on_done(result, error)`` is called on the Tk thread when it finishes.
+        """
+        dlg = tk.Toplevel(self)
+        dlg.title(title)
+        dlg.transient(self)
+        dlg.resizable(False, False)
+        dlg.protocol("WM_DELETE_WINDOW", lambda: None)  # can't cancel ReportLab mid-render
+
+        wrap = ttk.Frame(dlg, padding=14)
+        wrap.pack(fill="both", expand=True)
+        ttk.Label(wrap, text=message, justify="left").pack(anchor="w")
+        bar = ttk.Progressbar(wrap, mode="indeterminate", length=260)
+        bar.pack(fill="x", pady=(10, 0))
+        bar.start(12)
+
+        dlg.update_idletasks()
+        dlg.geometry(f"+{self.winfo_rootx()+120}+{self.winfo_rooty()+120}")
+        try:
+            dlg.grab_set()
+        except Exception:
+            pass
+
+        fut = self._pdf_executor.submit(work)
+
+        def _poll():
+            if not fut.done():
+                self.after(100, _poll)
+                return
+            try:
+                bar.stop()
+                dlg.grab_release()
+                dlg.destroy()
+            except Exception:
+                pass
+            err = fut.exception()
+            on_done(None if err is not None else fut.result(), err)
+
+        self.after(100, _poll)
+
     def export_all_exams_to_one_pdf(self):
         if not self._ensure_reportlab():
             return
@@ -9582,9 +10192,49 @@ class App(tk.Tk):
             messagebox.showinfo("PDF", "Enter Last, First, DOB, and DOI first.")
             return
 
-        ensure_patient_dirs(patient_root)
+        # Ensure current exam gets saved first (so disk-based exams are up to date),
+        # then check what is on disk before asking where to save the PDF.
+        try:
+            self._autosave(force=True)
+        except Exception:
+            pass
+
+        # Saved exams are read straight from disk (no loading each one into the
+        # UI); the on-screen exam uses make_payload() so unsaved edits are included.
+        current = self.current_exam.get()
+        skipped: list[str] = []
+        saved_files = self._saved_exam_filenames(patient_root)
+        exam_paths = self._exam_paths(patient_root)
+        # (exam, payload already built on the Tk thread, or the JSON path to read)
+        jobs: list[tuple[str, dict | None, str | None]] = []
+
+        for exam in self.exams:
+            exam_path = exam_paths.get(exam)
+            if not exam_path or os.path.basename(exam_path) not in saved_files:
+                skipped.append(exam)
+                continue
+
+            if exam == current:
+                try:
+                    jobs.append((exam, self.make_payload() or {}, None))
+                except Exception as e:
+                    skipped.append(f"{exam} (error: {e})")
+            else:
+                jobs.append((exam, None, exam_path))
+
+        def _no_exams_found():
+            messagebox.showinfo(
+                "Export All Exams",
+                "No saved exams found to export.\n\n"
+                "Tip: Save at least one exam first (Save Exam Now)."
+            )
+
+        if not jobs:
+            _no_exams_found()
+            return
+
+        self._ensure_patient_dirs(patient_root, PATIENT_SUBDIR_PDFS)
         pdf_dir = os.path.join(patient_root, PATIENT_SUBDIR_PDFS)
-        os.makedirs(pdf_dir, exist_ok=True)
 
         display = to_last_first(self.last_name_var.get(), self.first_name_var.get()) or "Patient"
         dob = (self.dob_var.get() or "").strip()
@@ -9605,57 +10255,56 @@ class App(tk.Tk):
         if not path:
             return
 
-        # Preserve current UI state
-        orig_exam = self.current_exam.get()
-        orig_page = self.current_page.get()
-        orig_case_path = self.current_case_path
-
-        payloads: list[dict] = []
-        skipped: list[str] = []
-
-        # Ensure current exam gets saved first (so disk-based exams are up to date)
-        try:
-            self._autosave(force=True)
-        except Exception:
-            pass
-
-        try:
-            # Build each exam payload using the same normalization as Export Current Exam
-            for exam in self.exams:
-                exam_path = self.compute_exam_path(exam)
-                if not exam_path or not os.path.exists(exam_path):
-                    skipped.append(exam)
-                    continue
-
-                try:
-                    # Load that exam into the UI (same mechanism used elsewhere)
-                    self.load_case_from_path(exam_path)
-
-                    # Now make the payload the SAME way Export Current does
-                    payload = self.make_payload() or {}
-                    if payload:
-                        payloads.append(payload)
-                    else:
-                        skipped.append(f"{exam} (empty payload)")
-                except Exception as e:
-                    skipped.append(f"{exam} (error: {e})")
+        def _work():
+            # Saved exams are independent reads; overlap them, then render in exam order.
+            to_read = [p for _e, _payload, p in jobs if p]
+            loaded: dict[str, object] = {}
+            if to_read:
+                with ThreadPoolExecutor(max_workers=min(8, len(to_read))) as ex:
+                    futs = {p: ex.submit(_load_saved_exam_payload, p) for p in to_read}
+                for p, f in futs.items():
+                    err = f.exception()
+                    loaded[p] = err if err is not None else f.result()
+
+            payloads: list[dict] = []
+            for exam, payload, p in jobs:
+                if p:
+                    payload = loaded[p]
+                    if isinstance(payload, Exception):
+                        skipped.append(f"{exam} (error: {payload})")
+                        continue
+                if payload:
+                    payloads.append(payload)
+                else:
+                    skipped.append(f"{exam} (empty payload)")
 
+            # Drop the payloads (incl. the on-screen exam's) before the "Open it now?"
+            # prompt, rather than keeping them alive through the modal wait.
+            jobs.clear()
+            loaded.clear()
             if not payloads:
-                messagebox.showinfo(
-                    "Export All Exams",
-                    "No saved exams found to export.\n\n"
-                    "Tip: Save at least one exam first (Save Exam Now)."
-                )
-                return
+                return False
+            try:
+                build_combined_pdf(path, payloads)
+            finally:
+                payloads.clear()
+            return True
 
-            # Build combined PDF
-            build_combined_pdf(path, payloads)
+        def _done(result, err):
+            if err is not None:
+                messagebox.showerror("Export Failed", f"Could not create the combined PDF:\n\n{err}")
+                return
+            if not result:
+                _no_exams_found()
+                return
 
             self.last_all_exams_pdf_path = path
             self.write_settings({
                 "last_exam_pdfs": self.last_exam_pdf_paths,
                 "last_all_exams_pdf": self.last_all_exams_pdf_path
             })
+            # One write for the autosave + export keys, before the modal prompt.
+            self.flush_settings_now()
 
             msg = f"All-exams PDF saved:\n{path}"
             if skipped:
@@ -9664,33 +10313,13 @@ class App(tk.Tk):
             if messagebox.askyesno("Success", msg + "\n\nOpen it now?"):
                 open_with_default_app(path)
 
-        except Exception as e:
-            messagebox.showerror("Export Failed", f"Could not create the combined PDF:\n\n{e}")
-
-        finally:
-            # Restore prior UI state as best as possible
-            try:
-                # Go back to the original exam if we can
-                if orig_exam in self.exams:
-                    self.current_exam.set(orig_exam)
-                    self._refresh_exam_button_styles()
-
-                    # If we had a file for it, load it back
-                    orig_path = self.compute_exam_path(orig_exam)
-                    if orig_path and os.path.exists(orig_path):
-                        try:
-                            self.load_case_from_path(orig_path)
-                        except Exception:
-                            pass
-
-                # Restore page view
-                if orig_page in self.pages:
-                    self.show_page(orig_page)
-
-                self.current_case_path = orig_case_path
-                self._apply_exam_color_theme()
-            except Exception:
-                pass
+        # Read saved exams + build combined PDF off the Tk thread
+        self._run_with_busy_dialog(
+            "Export All Exams",
+            f"Exporting {len(jobs)} exam(s) to one PDF…",
+            _work,
+            _done,
+        )
 
 
     # ---------- Start New Case ----------
@@ -9726,6 +10355,7 @@ class App(tk.Tk):
         self.last_all_exams_pdf_path = ""
         self.status_var.set("New case started. Previous cases/files are unchanged.")
         self.current_patient_id = None
+        self._clear_patient_path_caches()
         self._ensure_current_patient_id()
         try:
             self._refresh_referral_toggle_buttons()
@@ -1,5 +1,7 @@
 # config.py
+import functools
 import os
+import types
 from pathlib import Path
 from paths import get_data_dir, patients_dir
 
@@ -26,13 +28,33 @@ ACTIVE_YEAR = 2026
 PATIENTS_ROOT: Path = patients_dir()
 
 PATIENTS_ID_ROOT: Path = PATIENTS_ROOT / "id_cases"
-PATIENTS_ID_ROOT.mkdir(parents=True, exist_ok=True)
 
 YEAR_CASES_ROOT: Path = PATIENTS_ROOT / f"{ACTIVE_YEAR}cases"
 NEXT_YEAR_CASES_ROOT: Path = PATIENTS_ROOT / f"{ACTIVE_YEAR + 1}cases"
 
-YEAR_CASES_ROOT.mkdir(parents=True, exist_ok=True)
-NEXT_YEAR_CASES_ROOT.mkdir(parents=True, exist_ok=True)
+
+@functools.lru_cache(maxsize=None)
+def _ensured(p: Path) -> Path:
+    """mkdir -p once per process; later calls are a cache hit (no syscalls)."""
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def patients_id_root() -> Path:
+    """PATIENTS_ID_ROOT, created on first use. Read-only callers can use the constant."""
+    return _ensured(PATIENTS_ID_ROOT)
+
+
+def year_cases_root() -> Path:
+    """YEAR_CASES_ROOT, created on first use."""
+    return _ensured(YEAR_CASES_ROOT)
+
+
+def ensure_dirs() -> None:
+    """Create the case-storage roots. Called from utils.ensure_year_root(), not at import."""
+    patients_id_root()
+    year_cases_root()
+    _ensured(NEXT_YEAR_CASES_ROOT)
 
 # App settings stored at year root (external data dir)
 SETTINGS_PATH: Path = get_data_dir() / "_app_settings.json"
@@ -62,6 +84,25 @@ EXAM_COLORS = {
     "Final Exam": {"bg": "#FCE4EC", "accent": "#C2185B"},
 }
 
+# Dynamic exam names ("Initial 2", "Re-Exam 3", "Final 1") use their type's colours.
+_EXAM_COLOR_PREFIXES = (
+    ("Initial", "Initial"),
+    ("Re-Exam", "Re-Exam 1"),
+    ("Final", "Final Exam"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def exam_color_theme(exam: str) -> dict | None:
+    """EXAM_COLORS entry for an exam name (exact key first, then by exam type); None if unthemed."""
+    theme = EXAM_COLORS.get(exam)
+    if theme is None:
+        for prefix, key in _EXAM_COLOR_PREFIXES:
+            if exam.startswith(prefix):
+                theme = EXAM_COLORS.get(key)
+                break
+    return theme
+
 # ----------------- UI OPTIONS -----------------
 PAIN_DESCRIPTORS = [
     "Achy", "Sharp", "Soreness", "Tension", "Dull", "Burning", "Throbbing",
@@ -113,7 +154,7 @@ REGION_OPTIONS = [
 
 
 
-REGION_LABELS = {
+_REGION_LABELS = {
     "Head": "Head",
     "CS": "Cervical Spine",
     "TS": "Thoracic Spine",
@@ -168,9 +209,13 @@ REGION_LABELS = {
     "L_FOOT": "Left Foot",
     "BL_FEET": "Bilateral Feet",
 }
+# Read-only view shared by every page; nothing mutates the label table.
+REGION_LABELS = types.MappingProxyType(_REGION_LABELS)
+# Heading text -> is-a-region-label checks (Live Preview clicks) without scanning .values()
+REGION_LABEL_VALUES = frozenset(REGION_LABELS.values())
 
 
-REGION_MUSCLES = {
+_REGION_MUSCLES = {
     "CS": [
         "Upper trapezius",
         "Levator scapulae",
@@ -234,6 +279,10 @@ REGION_MUSCLES = {
     ],
 }
 
+# Tuples behind a read-only mapping: callers iterate these, never edit them.
+REGION_MUSCLES = types.MappingProxyType({k: tuple(v) for k, v in _REGION_MUSCLES.items()})
+del _REGION_MUSCLES
+
 # ----------------- PATIENT CHART SUBFOLDERS -----------------
 PATIENT_SUBDIR_EXAMS = "exams"
 PATIENT_SUBDIR_PDFS = "pdfs"
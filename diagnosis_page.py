@@ -1,6 +1,8 @@
 # diagnosis_page.py
 from __future__ import annotations
 
+import functools
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -17,10 +19,13 @@ def _strip_auto_tag(text: str) -> str:
     Removes the trailing AUTO_TAG line if present.
     Keeps your internal marker but prevents it from contaminating output.
     """
-    lines = (text or "").splitlines()
-    if lines and lines[-1].strip() == AUTO_TAG:
-        lines = lines[:-1]
-    return "\n".join(lines).strip()
+    t = (text or "").rstrip()
+    if not t.endswith(AUTO_TAG):
+        return t.strip()
+    head, _, last = t.rpartition("\n")
+    if last.strip() == AUTO_TAG:
+        t = head
+    return t.strip()
 
 def _clean(s: str) -> str:
     return (s or "").strip()
@@ -112,6 +117,8 @@ DX_LIST: list[tuple[str, str]] = [
 
     
 ]
+# Interned so the lookup tables and saved-display compares mostly hit identity checks.
+DX_LIST = [(sys.intern(lbl), sys.intern(code)) for lbl, code in DX_LIST]
 
 
 PROGNOSIS_CHOICES = ["(select)", "Poor", "Guarded", "Fair", "Good", "Excellent"]
@@ -162,11 +169,30 @@ def _dx_display(label: str, icd10: str) -> str:
     return f"{label} — {icd10}" if icd10 else label
 
 
-DX_DISPLAY_VALUES = [_dx_display(lbl, code) for (lbl, code) in DX_LIST]
+DX_DISPLAY_VALUES: tuple[str, ...] = tuple(sys.intern(_dx_display(lbl, code)) for (lbl, code) in DX_LIST)
 
+# O(1) lookups for block load / display parsing (DX_LIST is fixed at import).
+# The "-----" rows are visual separators only, so they never resolve by label.
+_DX_DISPLAY_SET = frozenset(DX_DISPLAY_VALUES)
+_DX_LABEL_TO_PAIR: dict[str, tuple[str, str]] = {}
+for _lbl, _code in DX_LIST:
+    if _lbl.startswith("---"):
+        continue
+    _DX_LABEL_TO_PAIR.setdefault(_clean(_lbl), (_lbl, _code))
+del _lbl, _code
 
-def all_dx_display_values() -> list[str]:
-    """Built-in DX_LIST favorites plus all favorites from favorite blocks."""
+
+_ALL_DX_DISPLAY_CACHE: tuple[str, ...] | None = None
+
+
+def all_dx_display_values() -> tuple[str, ...]:
+    """
+    Built-in DX_LIST favorites plus all favorites from favorite blocks.
+    One shared tuple for every Dx combobox; rebuilt after invalidate_dx_display_values().
+    """
+    global _ALL_DX_DISPLAY_CACHE
+    if _ALL_DX_DISPLAY_CACHE is not None:
+        return _ALL_DX_DISPLAY_CACHE
     values = list(DX_DISPLAY_VALUES)
     seen = set(values)
     for label, code in list_favorites():
@@ -174,22 +200,36 @@ def all_dx_display_values() -> list[str]:
         if disp and disp not in seen:
             values.append(disp)
             seen.add(disp)
-    return values
+    _ALL_DX_DISPLAY_CACHE = tuple(values)
+    return _ALL_DX_DISPLAY_CACHE
+
+
+def invalidate_dx_display_values() -> None:
+    """Call after the favorites store changes so the next dropdown refresh re-reads it."""
+    global _ALL_DX_DISPLAY_CACHE
+    _ALL_DX_DISPLAY_CACHE = None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_display_fixed(s: str) -> tuple[str, str] | None:
+    """Display -> (label, icd10) for the parts that never change; None = check favorites."""
+    if " — " in s:
+        left, right = s.split(" — ", 1)
+        return _clean(left), _clean(right)
+    return _DX_LABEL_TO_PAIR.get(s)
 
 
 def _parse_display_to_pair(display: str) -> tuple[str, str]:
     """
     Reverse the combobox display back into (label, icd10)
     """
-    s = _clean(display)
-    if " — " in s:
-        left, right = s.split(" — ", 1)
-        return _clean(left), _clean(right)
-    for lbl, code in DX_LIST:
-        if _clean(lbl) == s:
-            return lbl, code
+    s = (display or "").strip()
+    pair = _parse_display_fixed(s)
+    if pair is not None:
+        return pair
+    # Favorites live on disk and can change, so this fallback is never cached.
     for lbl, code in list_favorites():
-        if _clean(lbl) == s:
+        if (lbl or "").strip() == s:
             return lbl, code
     return s, ""
 
@@ -209,6 +249,7 @@ class DxBlock(ttk.Frame):
         self.number_var = tk.StringVar(value="Diagnosis #1")
         self.dx_display_var = tk.StringVar(value=display_values[0] if display_values else "")
         self.edit_var = tk.StringVar(value="")
+        self._cached_pair = (None, "", "")  # (display, label, code)
 
         # header row
         header = ttk.Frame(self)
@@ -216,7 +257,7 @@ class DxBlock(ttk.Frame):
 
         ttk.Label(header, textvariable=self.number_var, font=("Segoe UI", 10, "bold")).pack(side="left")
 
-        self.remove_btn = ttk.Button(header, text="Remove", command=lambda: self._call(self._on_remove))
+        self.remove_btn = ttk.Button(header, text="Remove", command=self._fire_remove)
         self.remove_btn.pack(side="right")
         ttk.Button(
             header,
@@ -229,12 +270,16 @@ class DxBlock(ttk.Frame):
         row1.pack(fill="x")
 
         ttk.Label(row1, text="Dx:").pack(side="left")
+        # Only the current pick is loaded up front; the full list is filled in
+        # by postcommand the first time this dropdown is opened.
+        self._values_src: tuple[str, ...] | None = None
         self.dx_cb = ttk.Combobox(
             row1,
             textvariable=self.dx_display_var,
-            values=display_values,
+            values=(self.dx_display_var.get(),),
             state="readonly",
             width=44,
+            postcommand=self._populate_values,
         )
         self._disable_mousewheel_on_cb(self.dx_cb)
         self.dx_cb.pack(side="left", padx=(6, 4), fill="x", expand=True)
@@ -248,15 +293,15 @@ class DxBlock(ttk.Frame):
         self.edit_entry = ttk.Entry(row2, textvariable=self.edit_var, width=30)
         self.edit_entry.pack(side="left", padx=(6, 8), fill="x", expand=True)
 
-        self.up_btn = ttk.Button(row2, text="↑", width=3, command=lambda: self._call(self._on_move_up))
+        self.up_btn = ttk.Button(row2, text="↑", width=3, command=self._fire_up)
         self.up_btn.pack(side="left", padx=(0, 4))
 
-        self.down_btn = ttk.Button(row2, text="↓", width=3, command=lambda: self._call(self._on_move_down))
+        self.down_btn = ttk.Button(row2, text="↓", width=3, command=self._fire_down)
         self.down_btn.pack(side="left")
 
         # traces call _on_change (if bound)
-        self.dx_display_var.trace_add("write", lambda *_: self._call(self._on_change))
-        self.edit_var.trace_add("write", lambda *_: self._call(self._on_change))
+        self.dx_display_var.trace_add("write", self._fire_change)
+        self.edit_var.trace_add("write", self._fire_change)
 
         self.configure(padding=4)
 
@@ -264,19 +309,52 @@ class DxBlock(ttk.Frame):
         if callable(fn):
             fn()
 
+    def _fire_change(self, *_):
+        fn = self._on_change
+        if fn is not None:
+            fn()
+
+    def _fire_remove(self):
+        fn = self._on_remove
+        if fn is not None:
+            fn()
+
+    def _fire_up(self):
+        fn = self._on_move_up
+        if fn is not None:
+            fn()
+
+    def _fire_down(self):
+        fn = self._on_move_down
+        if fn is not None:
+            fn()
+
     def _disable_mousewheel_on_cb(self, cb: ttk.Combobox):
         """Prevent mouse wheel from changing combobox selection when dropdown is closed."""
         cb.bind("<MouseWheel>", lambda e: "break")
         cb.bind("<Button-4>", lambda e: "break")
         cb.bind("<Button-5>", lambda e: "break")
 
+    def _populate_values(self) -> None:
+        """postcommand: load the shared Dx list (plus the current pick) if not already loaded."""
+        src = all_dx_display_values()
+        if src is self._values_src:
+            return
+        values = src
+        current = _clean(self.dx_display_var.get())
+        if current and current not in values:
+            values = list(values) + [current]
+        self.dx_cb.configure(values=values)
+        self._values_src = src
+
     def refresh_dropdown_values(self, *, keep_selection: bool = True) -> None:
         """Reload shared favorites into this block's combobox."""
         current = _clean(self.dx_display_var.get()) if keep_selection else ""
-        values = all_dx_display_values()
+        src = values = all_dx_display_values()
         if current and current not in values:
             values = list(values) + [current]
         self.dx_cb.configure(values=values)
+        self._values_src = src
         if current:
             self.dx_display_var.set(current)
         elif values:
@@ -286,10 +364,11 @@ class DxBlock(ttk.Frame):
         disp = _clean(display)
         if not disp:
             return
-        values = all_dx_display_values()
+        src = values = all_dx_display_values()
         if disp not in values:
             values = list(values) + [disp]
         self.dx_cb.configure(values=values)
+        self._values_src = src
         self.dx_display_var.set(disp)
 
     def _open_icd10_search(self) -> None:
@@ -299,6 +378,7 @@ class DxBlock(ttk.Frame):
         label, code = picked
         display = _dx_display(label, code)
         add_favorite(label, code)
+        invalidate_dx_display_values()
         page = self._diagnosis_page
         if page is not None and hasattr(page, "refresh_all_dx_dropdown_values"):
             page.refresh_all_dx_dropdown_values(select_block=self, display=display)
@@ -310,6 +390,7 @@ class DxBlock(ttk.Frame):
         page = self._diagnosis_page
 
         def _on_saved():
+            invalidate_dx_display_values()
             if page is not None and hasattr(page, "refresh_all_dx_dropdown_values"):
                 page.refresh_all_dx_dropdown_values()
 
@@ -331,11 +412,28 @@ class DxBlock(ttk.Frame):
         self._on_move_up = on_move_up
         self._on_move_down = on_move_down
 
+    def clear(self) -> None:
+        """Put the block back to the state of a freshly created one."""
+        display_values = all_dx_display_values()
+        first = display_values[0] if display_values else ""
+        self.dx_cb.configure(values=(first,))
+        self._values_src = None
+        self.dx_display_var.set(first)
+        self.edit_var.set("")
+
     def set_number(self, n: int):
-        self.number_var.set(f"Diagnosis #{n}")
+        new = f"Diagnosis #{n}"
+        if self.number_var.get() != new:
+            self.number_var.set(new)
 
     def get_label_code(self) -> tuple[str, str]:
-        return _parse_display_to_pair(self.dx_display_var.get())
+        disp = self.dx_display_var.get()
+        cached = self._cached_pair
+        if cached[0] == disp:
+            return cached[1], cached[2]
+        lbl, code = _parse_display_to_pair(disp)
+        self._cached_pair = (disp, lbl, code)
+        return lbl, code
 
     def to_line(self, n: int) -> str:
         lbl, code = self.get_label_code()
@@ -364,11 +462,11 @@ class DxBlock(ttk.Frame):
 
         if disp and " — " in disp:
             self._set_display_value(disp)
-        elif disp and disp in values:
+        elif disp and (disp in _DX_DISPLAY_SET or disp in values):
             self.dx_display_var.set(disp)
         elif lbl or code:
             display = _dx_display(lbl, code) if (lbl or code) else (values[0] if values else "")
-            if display in values:
+            if display in _DX_DISPLAY_SET or display in values:
                 self.dx_display_var.set(display)
             elif display:
                 self._set_display_value(display)
@@ -428,7 +526,9 @@ class DiagnosisPage(ttk.Frame):
         self.max_blocks = max_blocks
 
         self._loading = False
+        self._changed_after_id = None
         self.blocks: list[DxBlock] = []
+        self._last_positions: dict[DxBlock, tuple[int, int]] = {}
         
         # collapse states
         self.blocks_visible = tk.BooleanVar(value=False)
@@ -544,12 +644,15 @@ class DiagnosisPage(ttk.Frame):
             pass
 
     def _refresh_imaging_list(self):
-        self.imaging_list.delete(0, "end")
+        items = []
         for it in self.imaging_recs:
-            mod = _clean(it.get("modality", ""))
-            part = _clean(it.get("body_part", ""))
+            mod = (it.get("modality") or "").strip()
+            part = (it.get("body_part") or "").strip()
             if mod and part:
-                self.imaging_list.insert("end", f"{mod} of {part}")
+                items.append(f"{mod} of {part}")
+        self.imaging_list.delete(0, "end")
+        if items:
+            self.imaging_list.insert("end", *items)  # one Tcl call for all rows
         self._refresh_imaging_letter_buttons()
 
     def _refresh_imaging_letter_buttons(self):
@@ -562,7 +665,7 @@ class DiagnosisPage(ttk.Frame):
         for it in self.imaging_recs:
             if not isinstance(it, dict):
                 continue
-            mod = _clean(it.get("modality", ""))
+            mod = (it.get("modality") or "").strip()
             if not mod:
                 continue
             k = mod.lower()
@@ -675,11 +778,10 @@ class DiagnosisPage(ttk.Frame):
             pass
 
     def _refresh_ref_list(self):
+        items = [p for p in ((it.get("provider_type") or "").strip() for it in self.referrals) if p]
         self.ref_list.delete(0, "end")
-        for it in self.referrals:
-            p = _clean(it.get("provider_type", ""))
-            if p:
-                self.ref_list.insert("end", p)
+        if items:
+            self.ref_list.insert("end", *items)  # one Tcl call for all rows
         self._refresh_referral_letter_buttons()
 
     def _refresh_referral_letter_buttons(self):
@@ -695,7 +797,7 @@ class DiagnosisPage(ttk.Frame):
         for it in self.referrals:
             if not isinstance(it, dict):
                 continue
-            p = _clean(it.get("provider_type", ""))
+            p = (it.get("provider_type") or "").strip()
             if not p:
                 continue
             low = p.lower()
@@ -879,6 +981,27 @@ class DiagnosisPage(ttk.Frame):
             pass
 
     def _changed(self):
+        # Var traces fire for every .set() during a load; the loader notifies once when done.
+        if self._loading:
+            return
+        # Typing fires a trace per keystroke; tell the host once per burst.
+        if self._changed_after_id is not None:
+            try:
+                self.after_cancel(self._changed_after_id)
+            except Exception:
+                pass
+        self._changed_after_id = self.after(80, self._changed_now)
+
+    def _changed_now(self):
+        """Notify the host immediately (loaders use this so the notice lands inside their load)."""
+        if self._changed_after_id is not None:
+            try:
+                self.after_cancel(self._changed_after_id)
+            except Exception:
+                pass
+            self._changed_after_id = None
+        if self._loading:
+            return
         if callable(self.on_change_callback):
             self.on_change_callback()
 
@@ -1670,6 +1793,7 @@ class DiagnosisPage(ttk.Frame):
         display: str = "",
     ) -> None:
         """Sync every Dx combobox to the shared favorites list."""
+        invalidate_dx_display_values()
         disp = _clean(display)
         for b in self.blocks:
             if select_block is not None and b is select_block and disp:
@@ -1679,21 +1803,32 @@ class DiagnosisPage(ttk.Frame):
         if select_block is not None:
             self._on_blocks_changed()
 
-    def add_block(self):
-        if len(self.blocks) >= self.max_blocks:
-            return
-
+    def _new_block(self) -> DxBlock:
         b = DxBlock(self.grid_area, diagnosis_page=self)
 
         # Bind AFTER creation so ↑/↓ always works immediately
         b.bind_actions(
             on_change=self._on_blocks_changed,
-            on_remove=lambda bb=b: self.remove_block(bb),
-            on_move_up=lambda bb=b: self.move_block(bb, -1),   # swap: down = move to larger number
-            on_move_down=lambda bb=b: self.move_block(bb, +1), # swap: up = move to smaller number
+            on_remove=functools.partial(self.remove_block, b),
+            on_move_up=functools.partial(self.move_block, b, -1),   # swap: down = move to larger number
+            on_move_down=functools.partial(self.move_block, b, +1), # swap: up = move to smaller number
         )
+        return b
+
+    def _resize_blocks(self, n: int) -> list[DxBlock]:
+        """Keep the first n blocks (their widgets are reused), destroy the rest, create any missing."""
+        for b in self.blocks[n:]:
+            b.destroy()
+        del self.blocks[n:]
+        while len(self.blocks) < n:
+            self.blocks.append(self._new_block())
+        return self.blocks
+
+    def add_block(self):
+        if len(self.blocks) >= self.max_blocks:
+            return
 
-        self.blocks.append(b)
+        self.blocks.append(self._new_block())
         self._layout_blocks()
         self._on_blocks_changed()
 
@@ -1776,50 +1911,31 @@ class DiagnosisPage(ttk.Frame):
 
         self._loading = True
         try:
-            for b in list(self.blocks):
-                b.destroy()
-            self.blocks.clear()
-
-            for bd in prior_blocks:
-                b = DxBlock(self.grid_area, diagnosis_page=self)
-                b.bind_actions(
-                    on_change=self._on_blocks_changed,
-                    on_remove=lambda bb=b: self.remove_block(bb),
-                    on_move_up=lambda bb=b: self.move_block(bb, -1),
-                    on_move_down=lambda bb=b: self.move_block(bb, +1),
-                )
+            for b, bd in zip(self._resize_blocks(len(prior_blocks)), prior_blocks):
                 b.from_dict(bd)
-                self.blocks.append(b)
-
-            if not self.blocks:
-                b = DxBlock(self.grid_area, diagnosis_page=self)
-                b.bind_actions(
-                    on_change=self._on_blocks_changed,
-                    on_remove=lambda bb=b: self.remove_block(bb),
-                    on_move_up=lambda bb=b: self.move_block(bb, -1),
-                    on_move_down=lambda bb=b: self.move_block(bb, +1),
-                )
-                self.blocks.append(b)
 
             self._layout_blocks()
         finally:
             self._loading = False
 
-        self._changed()
+        self._changed_now()
         return True
 
     def _layout_blocks(self):
-        for child in self.grid_area.winfo_children():
-            child.grid_forget()
+        # Only re-grid blocks whose cell changed; removed blocks are destroyed by the caller.
+        placed = self._last_positions
+        for blk in [b for b in placed if b not in self.blocks]:
+            del placed[blk]
 
         for i, blk in enumerate(self.blocks):
             blk.set_number(i + 1)
-            r = i // 2
-            c = i % 2
-            blk.grid(row=r, column=c, sticky="nsew", padx=6, pady=6)
+            pos = (i // 2, i % 2)
+            if placed.get(blk) != pos:
+                blk.grid(row=pos[0], column=pos[1], sticky="nsew", padx=6, pady=6)
+                placed[blk] = pos
 
-        self.grid_area.update_idletasks()
-        self._on_blocks_inner_configure()
+        # Let Tk coalesce the geometry pass; the scrollregion is refreshed once it settles.
+        self.after_idle(self._on_blocks_inner_configure)
 
     
     def _on_blocks_changed(self):
@@ -1829,12 +1945,16 @@ class DiagnosisPage(ttk.Frame):
     
     def _set_text(self, s: str):
         """Backward compat: set the legacy 'text' into dx_block_notes when loading old saves."""
+        s = s or ""
         if getattr(self, "dx_block_notes_var", None) is not None:
-            self.dx_block_notes_var.set(s or "")
+            if self.dx_block_notes_var.get() != s:
+                self.dx_block_notes_var.set(s)
             if hasattr(self, "dx_block_notes") and self.dx_block_notes.winfo_exists():
-                self.dx_block_notes.delete("1.0", "end")
-                self.dx_block_notes.insert("1.0", s or "")
-                self.after_idle(self._fit_dx_block_notes_height)
+                # Same text already in the box (e.g. reload of an unchanged exam): leave it alone.
+                if self.dx_block_notes.get("1.0", "end-1c") != s:
+                    self.dx_block_notes.delete("1.0", "end")
+                    self.dx_block_notes.insert("1.0", s)
+                    self.after_idle(self._fit_dx_block_notes_height)
         try:
             if hasattr(self, "text") and self.text.winfo_exists():
                 self.text.edit_modified(False)
@@ -1871,7 +1991,7 @@ class DiagnosisPage(ttk.Frame):
             self._set_text(text or "")
         finally:
             self._loading = False
-        self._changed()
+        self._changed_now()
 
     def get_value(self) -> str:
         """Returns combined section notes for backward compat (e.g. soap['diagnosis'] string)."""
@@ -1889,9 +2009,12 @@ class DiagnosisPage(ttk.Frame):
     def reset(self):
         self._loading = True
         try:
-            for b in list(self.blocks):
+            # Keep the first block and clear it rather than rebuilding its widgets.
+            for b in self.blocks[1:]:
                 b.destroy()
-            self.blocks.clear()
+            del self.blocks[1:]
+            if self.blocks:
+                self.blocks[0].clear()
             for attr in ("dx_block_notes_var", "assessment_notes_var", "causation_general_notes_var",
                          "prognosis_notes_var", "imaging_notes_var", "referrals_notes_var", "employment_general_notes_var"):
                 v = getattr(self, attr, None)
@@ -1953,11 +2076,15 @@ class DiagnosisPage(ttk.Frame):
             except Exception:
                 pass
 
+            # Still loading, so add_block's change notice is swallowed; one _changed() below.
+            if self.blocks:
+                self._layout_blocks()
+            else:
+                self.add_block()
         finally:
             self._loading = False
 
-        self.add_block()
-        self._changed()
+        self._changed_now()
 
     def to_dict(self) -> dict:
         return {
@@ -2004,28 +2131,15 @@ class DiagnosisPage(ttk.Frame):
             #     self.text_visible.set(False)
                         # Always show tkRaise (Assessment, Prognosis, etc.) on load
             self.text_visible.set(True)
-            for b in list(self.blocks):
-                b.destroy()
-            self.blocks.clear()
 
+            # Reload into the blocks already on screen; only the surplus/shortfall
+            # is destroyed/created.
             blocks = data.get("blocks") or []
-            for bd in blocks:
-                b = DxBlock(self.grid_area, diagnosis_page=self)
-
-                b.bind_actions(
-                    on_change=self._on_blocks_changed,
-                    on_remove=lambda bb=b: self.remove_block(bb),
-                    on_move_up=lambda bb=b: self.move_block(bb, -1),   # swap: down = move to larger number
-                    on_move_down=lambda bb=b: self.move_block(bb, +1), # swap: up = move to smaller number
-                )
-
-                b.from_dict(bd or {})
-                self.blocks.append(b)
-
-            if not self.blocks:
-                self._loading = False
-                self.add_block()
-                self._loading = True
+            if blocks:
+                for b, bd in zip(self._resize_blocks(len(blocks)), blocks):
+                    b.from_dict(bd or {})
+            else:
+                self._resize_blocks(1)[0].clear()
 
             self._layout_blocks()
 
@@ -2057,16 +2171,12 @@ class DiagnosisPage(ttk.Frame):
 
             self.prognosis_var.set(data.get("prognosis") or "(select)")
 
-            self.imaging_recs = data.get("imaging_recs") or []
-            if not isinstance(self.imaging_recs, list):
-                self.imaging_recs = []
-            self.imaging_recs = [x for x in self.imaging_recs if isinstance(x, dict)]
+            raw = data.get("imaging_recs")
+            self.imaging_recs = [x for x in raw if isinstance(x, dict)] if isinstance(raw, list) else []
             self._refresh_imaging_list()
 
-            self.referrals = data.get("referrals") or []
-            if not isinstance(self.referrals, list):
-                self.referrals = []
-            self.referrals = [x for x in self.referrals if isinstance(x, dict)]
+            raw = data.get("referrals")
+            self.referrals = [x for x in raw if isinstance(x, dict)] if isinstance(raw, list) else []
             self._refresh_ref_list()
 
             try:
@@ -2119,5 +2229,5 @@ class DiagnosisPage(ttk.Frame):
         finally:
             self._loading = False
 
-        self._changed()
+        self._changed_now()
 
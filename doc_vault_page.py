@@ -3,12 +3,25 @@ from __future__ import annotations
 
 import os
 import shutil
+import stat
+import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from send2trash import send2trash
 
+# ----------- OPTIONAL: watchdog (live folder updates) -----------
+WATCHDOG_OK = False
+try:
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+    from watchdog.observers import Observer  # type: ignore
+    WATCHDOG_OK = True
+except Exception:
+    WATCHDOG_OK = False
+
 # Vault folder names (inside patient root)
 VAULT_FOLDERS = [
     "attorney",
@@ -35,44 +48,77 @@ def upsert_vault_file(patient_root: str, folder_key: str, src_path: str, dest_fi
     dest_path = os.path.join(dest_dir, dest_filename)
     tmp = dest_path + ".tmp"
 
-    shutil.copy2(src_path, tmp)
+    copy_file_keep_mtime(src_path, tmp)
     os.replace(tmp, dest_path)  # atomic replace
 
     return dest_path
 
 
+def copy_file_keep_mtime(src: str, dest: str) -> None:
+    """Copy bytes, then carry over only the timestamps (copy2's full copystat is not needed here)."""
+    shutil.copyfile(src, dest)
+    try:
+        st = os.stat(src)
+        os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError:
+        pass
+
+
+def _popen_launcher(cmd: str):
+    def _launch(path: str) -> None:
+        subprocess.Popen(
+            [cmd, path],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    return _launch
+
+
+# Platform launcher, picked once at import.
+if sys.platform.startswith("win"):
+    _launch = os.startfile  # type: ignore[attr-defined]
+elif sys.platform == "darwin":
+    _launch = _popen_launcher("open")
+else:
+    _launch = _popen_launcher("xdg-open")
+
+
 def open_with_default_app(path: str):
     try:
-        if sys.platform.startswith("win"):
-            os.startfile(path)  # type: ignore[attr-defined]
-        elif sys.platform == "darwin":
-            os.system(f'open "{path}"')
-        else:
-            os.system(f'xdg-open "{path}"')
+        _launch(path)
     except Exception as e:
         raise RuntimeError(str(e))
 
-def unique_dest_path(dest_dir: str, filename: str) -> str:
+def existing_names(dest_dir: str) -> set[str]:
+    """Snapshot of the names in dest_dir (normcased), for unique_dest_path."""
+    try:
+        return {os.path.normcase(n) for n in os.listdir(dest_dir)}
+    except OSError:
+        return set()
+
+
+def unique_dest_path(dest_dir: str, filename: str, existing: set[str] | None = None) -> str:
     """
     If dest exists, append _HHMMSS (and if still exists, add increment).
+    `existing` is a names snapshot from existing_names(); the chosen name is added
+    to it so a batch of imports never picks the same name twice.
     """
+    if existing is None:
+        existing = existing_names(dest_dir)
+
     base = os.path.basename(filename)
     name, ext = os.path.splitext(base)
-    candidate = os.path.join(dest_dir, base)
-    if not os.path.exists(candidate):
-        return candidate
-
-    stamp = datetime.now().strftime("%H%M%S")
-    candidate = os.path.join(dest_dir, f"{name}_{stamp}{ext}")
-    if not os.path.exists(candidate):
-        return candidate
-
-    i = 2
-    while True:
-        candidate = os.path.join(dest_dir, f"{name}_{stamp}_{i}{ext}")
-        if not os.path.exists(candidate):
-            return candidate
-        i += 1
+    candidate = base
+    if os.path.normcase(candidate) in existing:
+        stamp = datetime.now().strftime("%H%M%S")
+        candidate = f"{name}_{stamp}{ext}"
+        i = 2
+        while os.path.normcase(candidate) in existing:
+            candidate = f"{name}_{stamp}_{i}{ext}"
+            i += 1
+
+    existing.add(os.path.normcase(candidate))
+    return os.path.join(dest_dir, candidate)
 
 class FolderPanel(ttk.Frame):
     def __init__(
@@ -83,14 +129,25 @@ class FolderPanel(ttk.Frame):
         set_status_fn,
         list_item_style_fn=None,
         sort_files_fn=None,
+        on_fs_change_fn=None,
     ):
         super().__init__(parent)
         self.get_folder_path_fn = get_folder_path_fn
         self.set_status_fn = set_status_fn
         self.list_item_style_fn = list_item_style_fn
         self.sort_files_fn = sort_files_fn
+        # Called instead of refresh() when the watched folder changes, so the
+        # owner can defer relisting while its page is hidden.
+        self.on_fs_change_fn = on_fs_change_fn
         self.folder_key: str | None = None
         self._row_basename: list[str] = []
+        self._last_signature: tuple[str, int] | None = None
+        self._import_state: dict | None = None
+        self._observer = None
+        self._watched_dir: str | None = None
+        self._fs_event: threading.Event | None = None
+        self._fs_poll_after_id = None
+        self._fs_refresh_after_id = None
         self._build()
 
     def _build(self):
@@ -107,10 +164,10 @@ class FolderPanel(ttk.Frame):
         ttk.Button(btns, text="Open Selected", command=self.open_selected).pack(side="left", padx=8)
         ttk.Button(btns, text="Delete Selected", command=self.delete_selected).pack(side="left", padx=8)
         ttk.Button(btns, text="Reveal Folder", command=self.reveal_folder).pack(side="left", padx=8)
-        ttk.Button(btns, text="Refresh List", command=self.refresh).pack(side="left", padx=8)
+        ttk.Button(btns, text="Refresh List", command=lambda: self.refresh(force=True)).pack(side="left", padx=8)
 
 
-        self.listbox = tk.Listbox(self, height=18)
+        self.listbox = tk.Listbox(self, height=18, selectmode=tk.EXTENDED)
         self.listbox.pack(fill="both", expand=True)
 
         ttk.Label(
@@ -122,7 +179,84 @@ class FolderPanel(ttk.Frame):
 
         self._show_placeholder()
 
+    # ---------- folder watching (watchdog, if installed) ----------
+    def _watch(self, d: str | None) -> None:
+        """Follow the listed folder so files dropped in from outside show up without Refresh."""
+        if not WATCHDOG_OK or d == self._watched_dir:
+            return
+        self._stop_watch()
+        if not d:
+            return
+        fs_event = threading.Event()
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Observer thread: never touch Tk here, just flag it for _poll_fs_events.
+                fs_event.set()
+
+        try:
+            obs = Observer()
+            obs.schedule(_Handler(), d, recursive=False)
+            obs.start()
+        except Exception:
+            return
+        self._observer = obs
+        self._watched_dir = d
+        self._fs_event = fs_event
+        self._fs_poll_after_id = self.after(250, self._poll_fs_events)
+
+    def _stop_watch(self) -> None:
+        obs = self._observer
+        self._observer = None
+        self._watched_dir = None
+        self._fs_event = None
+        for attr in ("_fs_poll_after_id", "_fs_refresh_after_id"):
+            after_id = getattr(self, attr)
+            setattr(self, attr, None)
+            if after_id is not None:
+                try:
+                    self.after_cancel(after_id)
+                except Exception:
+                    pass
+        if obs is not None:
+            try:
+                obs.stop()
+                obs.join(timeout=2.0)
+            except Exception:
+                pass
+
+    def _poll_fs_events(self) -> None:
+        self._fs_poll_after_id = None
+        ev = self._fs_event
+        if ev is None:
+            return
+        if ev.is_set():
+            ev.clear()
+            self._on_fs_change()
+        self._fs_poll_after_id = self.after(250, self._poll_fs_events)
+
+    def _on_fs_change(self) -> None:
+        # A copy can raise several events; relist once things settle.
+        if self._fs_refresh_after_id is not None:
+            try:
+                self.after_cancel(self._fs_refresh_after_id)
+            except Exception:
+                pass
+        self._fs_refresh_after_id = self.after(250, self._flush_fs_change)
+
+    def _flush_fs_change(self) -> None:
+        self._fs_refresh_after_id = None
+        if callable(self.on_fs_change_fn):
+            self.on_fs_change_fn()
+        else:
+            self.refresh()
+
+    def destroy(self):
+        self._stop_watch()
+        super().destroy()
+
     def _show_placeholder(self, msg: str | None = None):
+        self._last_signature = None
         self.listbox.delete(0, tk.END)
         self.listbox.insert(tk.END, msg or "(Enter patient demographics to enable the vault.)")
 
@@ -142,16 +276,31 @@ class FolderPanel(ttk.Frame):
             return
         self.refresh()
 
-    def refresh(self):
-        self.listbox.delete(0, tk.END)
-        self._row_basename = []
+    def refresh(self, force: bool = False):
         d = self._current_dir()
-        if not d or not os.path.isdir(d):
+        try:
+            st = os.stat(d) if d else None
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISDIR(st.st_mode):
+            self._watch(None)
+            self._row_basename = []
             self._show_placeholder("(Enter patient demographics to enable the vault.)")
             return
+        self._watch(d)
+
+        # Same folder, untouched since the last listing: nothing to redo.
+        sig = (d, st.st_mtime_ns)
+        if not force and sig == self._last_signature:
+            return
 
+        self.listbox.delete(0, tk.END)
+        self._row_basename = []
+
+        # One scandir pass: the dirent already says file vs folder, no per-name stat.
         try:
-            files = sorted(os.listdir(d), key=lambda x: x.lower())
+            with os.scandir(d) as it:
+                files = sorted((e.name for e in it if e.is_file()), key=str.casefold)
         except Exception:
             files = []
 
@@ -159,41 +308,44 @@ class FolderPanel(ttk.Frame):
             try:
                 files = self.sort_files_fn(self.folder_key, files)
             except Exception:
-                files = sorted(files, key=lambda x: x.lower())
+                files = sorted(files, key=str.casefold)
 
-        any_file = False
-        row = 0
+        rows: list[str] = []
+        colored: list[tuple[int, str]] = []
         for f in files:
-            fp = os.path.join(d, f)
-            if os.path.isfile(fp):
-                disp = f
-                fg = None
-                if self.list_item_style_fn and self.folder_key:
-                    try:
-                        meta = self.list_item_style_fn(self.folder_key, f)
-                        if isinstance(meta, dict):
-                            fg = meta.get("foreground")
-                            if meta.get("stale"):
-                                disp = f"{f}  — off chart"
-                        elif isinstance(meta, str):
-                            fg = meta
-                    except Exception:
-                        pass
-                self.listbox.insert(tk.END, disp)
-                self._row_basename.append(f)
-                if fg:
-                    try:
-                        self.listbox.itemconfig(row, foreground=fg, selectforeground=fg)
-                    except tk.TclError:
-                        try:
-                            self.listbox.itemconfig(row, fg=fg)
-                        except tk.TclError:
-                            pass
-                row += 1
-                any_file = True
-
-        if not any_file:
+            disp = f
+            fg = None
+            if self.list_item_style_fn and self.folder_key:
+                try:
+                    meta = self.list_item_style_fn(self.folder_key, f)
+                    if isinstance(meta, dict):
+                        fg = meta.get("foreground")
+                        if meta.get("stale"):
+                            disp = f"{f}  — off chart"
+                    elif isinstance(meta, str):
+                        fg = meta
+                except Exception:
+                    pass
+            if fg:
+                colored.append((len(rows), fg))
+            rows.append(disp)
+            self._row_basename.append(f)
+
+        self._last_signature = sig
+        if not rows:
             self.listbox.insert(tk.END, "(No files in this folder yet.)")
+            return
+
+        # One insert for every row, then color only the rows that need it.
+        self.listbox.insert(tk.END, *rows)
+        for row, fg in colored:
+            try:
+                self.listbox.itemconfig(row, foreground=fg, selectforeground=fg)
+            except tk.TclError:
+                try:
+                    self.listbox.itemconfig(row, fg=fg)
+                except tk.TclError:
+                    pass
 
     def import_files(self):
         d = self._current_dir()
@@ -209,20 +361,67 @@ class FolderPanel(ttk.Frame):
         )
         if not paths:
             return
+        if self._import_state is not None:
+            messagebox.showinfo("Import", "An import is still running. Please wait for it to finish.")
+            return
 
-        added = 0
+        # Pick every destination name up front so parallel copies can't collide.
+        jobs: list[tuple[str, str]] = []
+        taken = existing_names(d)
         for src in paths:
             if not os.path.exists(src):
                 continue
-            dest = unique_dest_path(d, os.path.basename(src))
-            try:
-                shutil.copy2(src, dest)
-                added += 1
-            except Exception as e:
-                messagebox.showwarning("Import", f"Could not import:\n{src}\n\n{e}")
+            jobs.append((src, unique_dest_path(d, os.path.basename(src), taken)))
 
-        self.refresh()
-        self.set_status_fn(f"Imported {added} file(s) into {self.folder_key}.")
+        if not jobs:
+            self.refresh(force=True)
+            self.set_status_fn(f"Imported 0 file(s) into {self.folder_key}.")
+            return
+
+        total = len(jobs)
+        self._import_state = {"done": 0, "added": 0, "total": total, "folder_key": self.folder_key, "futs": []}
+        self.set_status_fn(f"Importing {total} file(s) into {self.folder_key}…")
+
+        # Copies are I/O bound (the GIL is released), so a few run at once. Workers
+        # never call into Tk; the Tk thread polls for finished copies.
+        ex = ThreadPoolExecutor(max_workers=min(8, total), thread_name_prefix="vault-import")
+        for src, dest in jobs:
+            self._import_state["futs"].append((ex.submit(copy_file_keep_mtime, src, dest), src))
+        ex.shutdown(wait=False)
+        self.after(100, self._poll_import)
+
+    def _poll_import(self) -> None:
+        state = self._import_state
+        if state is None:
+            return
+        pending = []
+        for fut, src in state["futs"]:
+            if fut.done():
+                self._on_import_progress(fut, src)
+            else:
+                pending.append((fut, src))
+        if self._import_state is state:
+            state["futs"] = pending
+            self.after(100, self._poll_import)
+
+    def _on_import_progress(self, fut: Future, src: str) -> None:
+        state = self._import_state
+        if state is None:
+            return
+        state["done"] += 1
+        err = fut.exception()
+        if err is None:
+            state["added"] += 1
+
+        if state["done"] >= state["total"]:
+            self._import_state = None
+            self.refresh(force=True)
+            self.set_status_fn(f"Imported {state['added']} file(s) into {state['folder_key']}.")
+        else:
+            self.set_status_fn(f"Importing into {state['folder_key']}… {state['done']}/{state['total']}")
+
+        if err is not None:
+            messagebox.showwarning("Import", f"Could not import:\n{src}\n\n{err}")
 
     def open_selected(self):
         d = self._current_dir()
@@ -262,28 +461,39 @@ class FolderPanel(ttk.Frame):
             messagebox.showinfo("Delete", "Select a file from the list.")
             return
 
-        idx = sel[0]
-        fname = self.listbox.get(idx)
-        if idx < len(self._row_basename):
-            fname = self._row_basename[idx]
-        if fname.startswith("("):
+        names: list[str] = []
+        for idx in sel:
+            fname = self.listbox.get(idx)
+            if idx < len(self._row_basename):
+                fname = self._row_basename[idx]
+            if not fname.startswith("("):
+                names.append(fname)
+        if not names:
             return
 
-        path = os.path.join(d, fname)
-        if not os.path.exists(path):
-            messagebox.showerror("Delete", "File not found on disk.")
-            self.refresh()
+        paths = [os.path.join(d, n) for n in names]
+        missing = [n for n, p in zip(names, paths) if not os.path.exists(p)]
+        if missing:
+            messagebox.showerror("Delete", "File not found on disk:\n\n" + "\n".join(missing))
+            self.refresh(force=True)
             return
 
-        if not messagebox.askyesno("Delete File", f"Delete this file?\n\n{fname}\n\nThis cannot be undone."):
+        if len(names) == 1:
+            prompt = f"Delete this file?\n\n{names[0]}\n\nThis cannot be undone."
+        else:
+            shown = "\n".join(names[:10]) + (f"\n… and {len(names) - 10} more" if len(names) > 10 else "")
+            prompt = f"Delete these {len(names)} files?\n\n{shown}\n\nThis cannot be undone."
+        if not messagebox.askyesno("Delete File", prompt):
             return
 
         try:
-            send2trash(path)  #os.remove(path)  # permanent delete
-            self.refresh()
-            self.set_status_fn(f"Deleted: {fname}")
+            # send2trash takes a list, so the whole selection goes in one call.
+            send2trash(paths if len(paths) > 1 else paths[0])  #os.remove(path)  # permanent delete
+            self.refresh(force=True)
+            self.set_status_fn(f"Deleted: {names[0]}" if len(names) == 1 else f"Deleted {len(names)} files.")
         except Exception as e:
-            messagebox.showerror("Delete Failed", f"Could not delete:\n{fname}\n\n{e}")
+            self.refresh(force=True)
+            messagebox.showerror("Delete Failed", "Could not delete:\n" + "\n".join(names) + f"\n\n{e}")
 
 
     def reveal_folder(self):
@@ -302,12 +512,16 @@ class DocVaultPage(ttk.Frame):
     Patient-linked doc vault page (no duplicate demographics).
     Uses chiro_app patient_root as the "case folder".
     """
-    def __init__(self, parent, on_change_callback, get_patient_root_fn, list_item_style_fn=None, sort_files_fn=None):
+    def __init__(self, parent, on_change_callback, get_patient_root_fn, list_item_style_fn=None, sort_files_fn=None, on_fs_change_fn=None):
         super().__init__(parent)
         self.on_change_callback = on_change_callback
         self.get_patient_root_fn = get_patient_root_fn  # returns patient_root or None
         self.list_item_style_fn = list_item_style_fn
         self.sort_files_fn = sort_files_fn
+        self.on_fs_change_fn = on_fs_change_fn
+        self._ensured_roots: set[str] = set()
+        self._cached_pr: str | None = None
+        self._folder_cache: dict[str, str] = {}
 
         self._build_ui()
 
@@ -315,7 +529,8 @@ class DocVaultPage(ttk.Frame):
         try:
             self.ensure_vault_dirs()
             if hasattr(self, "folder_panel") and self.folder_panel:
-                self.folder_panel.refresh()
+                # Row colors follow chart state, not just the folder contents.
+                self.folder_panel.refresh(force=True)
         except Exception:
             pass
 
@@ -327,18 +542,26 @@ class DocVaultPage(ttk.Frame):
         return os.path.join(pr, "vault")
 
     def _folder_path(self, key: str) -> str | None:
-        vr = self._vault_root()
-        if not vr:
+        pr = self.get_patient_root_fn()
+        if not pr:
             return None
-        return os.path.join(vr, key)
+        if pr != self._cached_pr:
+            # Joined once per patient root instead of on every click/refresh.
+            vr = os.path.join(pr, "vault")
+            self._folder_cache = {k: os.path.join(vr, k) for k in VAULT_FOLDERS}
+            self._cached_pr = pr
+        path = self._folder_cache.get(key)
+        return path if path is not None else os.path.join(pr, "vault", key)
 
     def ensure_vault_dirs(self):
         vr = self._vault_root()
-        if not vr:
+        if not vr or vr in self._ensured_roots:
             return
         os.makedirs(vr, exist_ok=True)
         for k in VAULT_FOLDERS:
             os.makedirs(os.path.join(vr, k), exist_ok=True)
+        # Keyed by vault root, so switching patients re-checks the new one.
+        self._ensured_roots.add(vr)
 
     def _build_ui(self):
         outer = ttk.Frame(self)
@@ -392,6 +615,7 @@ class DocVaultPage(ttk.Frame):
             set_status_fn=self.set_status,
             list_item_style_fn=self.list_item_style_fn,
             sort_files_fn=self.sort_files_fn,
+            on_fs_change_fn=self.on_fs_change_fn,
         )
         self.folder_panel.pack(fill="both", expand=True, pady=(8, 0))
 
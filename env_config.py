@@ -2,8 +2,12 @@
 import os
 from dotenv import load_dotenv
 
-# Automatically loads .env from same folder or parent folders
-load_dotenv()
+# .env (same folder or parent folders) is loaded on the first get_env() call.
+_loaded = False
 
 def get_env(key: str, default: str = "") -> str:
-    return os.getenv(key, default)
\ No newline at end of file
+    global _loaded
+    if not _loaded:
+        load_dotenv()
+        _loaded = True
+    return os.getenv(key, default)
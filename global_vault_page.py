@@ -64,9 +64,10 @@ class GlobalVaultPage(ttk.Frame):
     demographics, since these documents are shared across every chart.
     """
 
-    def __init__(self, parent, on_change_callback=None):
+    def __init__(self, parent, on_change_callback=None, on_fs_change_fn=None):
         super().__init__(parent)
         self.on_change_callback = on_change_callback
+        self.on_fs_change_fn = on_fs_change_fn
         self._build_ui()
         # Auto-select the first folder so the right-hand panel never shows the
         # per-patient placeholder text inherited from FolderPanel.
@@ -87,7 +88,7 @@ class GlobalVaultPage(ttk.Frame):
         try:
             self.ensure_vault_dirs()
             if hasattr(self, "folder_panel") and self.folder_panel:
-                self.folder_panel.refresh()
+                self.folder_panel.refresh(force=True)
         except Exception:
             pass
 
@@ -141,6 +142,7 @@ class GlobalVaultPage(ttk.Frame):
             right,
             get_folder_path_fn=self._folder_path,
             set_status_fn=self.set_status,
+            on_fs_change_fn=self.on_fs_change_fn,
         )
         self.folder_panel.pack(fill="both", expand=True, pady=(8, 0))
 
@@ -1,4 +1,6 @@
 # objectives.py
+import sys
+import weakref
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from config import REGION_OPTIONS, REGION_LABELS, REGION_MUSCLES
@@ -31,11 +33,11 @@ SEVERITY_LABELS = {
     8: "Very Severe",
     9: "Intolerable",
 }
-SEVERITY_VALUES = list(range(10))
+SEVERITY_VALUES = tuple(range(10))
 
-POSTURE_LEVELS = ["(none)", "Normal/Level", "Left high", "Right high"]
-POSTURE_SEVERITY = ["(none)", "Mild", "Moderate", "Severe"]
-LORDOSIS_LEVELS = ["(none)", "Normal", "Decreased", "Increased"]
+POSTURE_LEVELS = ("(none)", "Normal/Level", "Left high", "Right high")
+POSTURE_SEVERITY = ("(none)", "Mild", "Moderate", "Severe")
+LORDOSIS_LEVELS = ("(none)", "Normal", "Decreased", "Increased")
 
 # -----------------------------
 # Region-specific Ortho + ROM
@@ -101,10 +103,13 @@ REGION_ROM_MOTIONS = {
     "BL_ANKLE": ["Dorsiflexion", "Plantarflexion", "Inversion", "Eversion"],
 }
 
+# Read-only from here on: tuples of interned names, interned region-code keys
+REGION_ORTHO_TESTS = {sys.intern(k): tuple(map(sys.intern, v)) for k, v in REGION_ORTHO_TESTS.items()}
+REGION_ROM_MOTIONS = {sys.intern(k): tuple(map(sys.intern, v)) for k, v in REGION_ROM_MOTIONS.items()}
 
 ADL_ITEMS = DEFAULT_ADL_ITEMS
 
-ADL_SEV_CHOICES = ["(select)"] + [str(i) for i in range(10)]  # 0-9
+ADL_SEV_CHOICES = ("(select)",) + tuple(str(i) for i in range(10))  # 0-9
 ADL_GRID_COLUMNS = 2
 ADL_SCROLL_HEIGHT = 280
 
@@ -161,39 +166,42 @@ def _region_group_name(label: str) -> str:
         return label
     return f"{label} Spine"
 
-def _region_tag(code: str) -> str:
-    c = (code or "").strip()
-    mapping = {
-        "CS": "C/S",
-        "TS": "T/S",
-        "LS": "L/S",
+# region code -> short display tag (and the reverse, for Live Preview clicks)
+_REGION_TAG_MAP = {
+    "CS": "C/S",
+    "TS": "T/S",
+    "LS": "L/S",
 
-        "R_SHOULDER": "R Shoulder",
-        "L_SHOULDER": "L Shoulder",
-        "BL_SHOULDER": "B/L Shoulders",
+    "R_SHOULDER": "R Shoulder",
+    "L_SHOULDER": "L Shoulder",
+    "BL_SHOULDER": "B/L Shoulders",
 
-        "R_ELBOW": "R Elbow",
-        "L_ELBOW": "L Elbow",
-        "BL_ELBOW": "B/L Elbows",
+    "R_ELBOW": "R Elbow",
+    "L_ELBOW": "L Elbow",
+    "BL_ELBOW": "B/L Elbows",
 
-        "R_WRIST": "R Wrist",
-        "L_WRIST": "L Wrist",
-        "BL_WRIST": "B/L Wrists",
+    "R_WRIST": "R Wrist",
+    "L_WRIST": "L Wrist",
+    "BL_WRIST": "B/L Wrists",
 
-        "R_HIP": "R Hip",
-        "L_HIP": "L Hip",
-        "BL_HIP": "B/L Hips",
+    "R_HIP": "R Hip",
+    "L_HIP": "L Hip",
+    "BL_HIP": "B/L Hips",
 
-        "R_KNEE": "R Knee",
-        "L_KNEE": "L Knee",
-        "BL_KNEE": "B/L Knees",
+    "R_KNEE": "R Knee",
+    "L_KNEE": "L Knee",
+    "BL_KNEE": "B/L Knees",
 
-        "R_ANKLE": "R Ankle",
-        "L_ANKLE": "L Ankle",
-        "BL_ANKLE": "B/L Ankles",
-    }
+    "R_ANKLE": "R Ankle",
+    "L_ANKLE": "L Ankle",
+    "BL_ANKLE": "B/L Ankles",
+}
+_REGION_TAG_MAP = {sys.intern(k): sys.intern(v) for k, v in _REGION_TAG_MAP.items()}
+_TAG_TO_REGION_CODE = {tag: code for code, tag in _REGION_TAG_MAP.items()}
 
-    return mapping.get(c, c if c and c != "(none)" else "")
+def _region_tag(code: str) -> str:
+    c = (code or "").strip()
+    return _REGION_TAG_MAP.get(c, c if c and c != "(none)" else "")
 
 def _code_from_tag(tag: str) -> str:
     """
@@ -204,53 +212,51 @@ def _code_from_tag(tag: str) -> str:
     if not t or t == "(none)":
         return ""
 
-    # Build the same mapping used by _region_tag
-    mapping = {
-        "CS": "C/S",
-        "TS": "T/S",
-        "LS": "L/S",
-
-        "R_SHOULDER": "R Shoulder",
-        "L_SHOULDER": "L Shoulder",
-        "BL_SHOULDER": "B/L Shoulders",
-
-        "R_ELBOW": "R Elbow",
-        "L_ELBOW": "L Elbow",
-        "BL_ELBOW": "B/L Elbows",
+    code = _TAG_TO_REGION_CODE.get(t)
+    if code:
+        return code
 
-        "R_WRIST": "R Wrist",
-        "L_WRIST": "L Wrist",
-        "BL_WRIST": "B/L Wrists",
+    # Fallback: assume tag itself is the code if any block uses it
+    return t
 
-        "R_HIP": "R Hip",
-        "L_HIP": "L Hip",
-        "BL_HIP": "B/L Hips",
+def _set_int_var(var: tk.IntVar, value) -> None:
+    """Set an IntVar only when the value differs (skips a no-op trace write)."""
+    value = int(value)
+    if var.get() != value:
+        var.set(value)
 
-        "R_KNEE": "R Knee",
-        "L_KNEE": "L Knee",
-        "BL_KNEE": "B/L Knees",
 
-        "R_ANKLE": "R Ankle",
-        "L_ANKLE": "L Ankle",
-        "BL_ANKLE": "B/L Ankles",
-    }
+# -----------------------------
+# Change notices coalesced to one per idle cycle
+# (bursts of trace writes -> one on_change call)
+# -----------------------------
+class _Debounced:
+    _change_after_id = None
 
-    for code, display in mapping.items():
-        if display == t:
-            return code
+    def _schedule_change(self):
+        if self._change_after_id is None:
+            self._change_after_id = self.after_idle(self._flush_change)
 
-    # Fallback: assume tag itself is the code if any block uses it
-    return t
+    def _flush_change(self):
+        """Deliver any pending notice now (loaders call this so the host hears before they return)."""
+        if self._change_after_id is not None:
+            try:
+                self.after_cancel(self._change_after_id)
+            except Exception:
+                pass
+            self._change_after_id = None
+        if callable(self.on_change):
+            self.on_change()
 
 
 # -----------------------------
 # Toggleable Radiobutton group (TTK-safe)
 # Click same value again => deselect to -1
 # -----------------------------
-class ToggleRadioGroup(ttk.Frame):
+class ToggleRadioGroup(_Debounced, ttk.Frame):
     def __init__(self, parent, values, var: tk.IntVar, on_change=None, text_map=None, btn_width=3):
         super().__init__(parent)
-        self.values = list(values)
+        self.values = tuple(values)
         self.var = var
         self.on_change = on_change
         self.text_map = text_map or (lambda v: str(v))
@@ -258,18 +264,35 @@ class ToggleRadioGroup(ttk.Frame):
         self._build()
 
     def _build(self):
-        for i, v in enumerate(self.values):
+        texts = list(map(self.text_map, self.values))
+        # one bound handler per group; the clicked button's value is looked up by widget path
+        self._btn_value = {}
+        self._rbs = []
+        for i, (v, text) in enumerate(zip(self.values, texts)):
             rb = ttk.Radiobutton(
                 self,
-                text=self.text_map(v),
+                text=text,
                 value=v,
                 variable=self.var,
                 width=self.btn_width,
                 takefocus=False,
             )
-            rb.bind("<Button-1>", lambda e, vv=v: self._on_click(vv))
+            self._btn_value[str(rb)] = v
+            self._rbs.append(rb)
+            rb.bind("<Button-1>", self._dispatch_click)
             rb.grid(row=0, column=i, sticky="w", padx=(0, 2))
 
+    def set_enabled(self, on: bool):
+        flag = "!disabled" if on else "disabled"
+        for rb in self._rbs:
+            rb.state([flag])
+
+    def _dispatch_click(self, event):
+        v = self._btn_value.get(str(event.widget))
+        if v is None:
+            return None
+        return self._on_click(v)
+
     def _on_click(self, v):
         current = int(self.var.get())
         if current == v:
@@ -277,18 +300,27 @@ class ToggleRadioGroup(ttk.Frame):
         else:
             self.var.set(v)
 
-        if callable(self.on_change):
-            self.on_change()
+        self._schedule_change()
 
         return "break"
 
+# Text path -> owning CollapsibleAutoNotes; the "AutoNotes" class bindings dispatch through it
+_AUTO_NOTES = weakref.WeakValueDictionary()
+
+
+def _auto_notes_event(event, handler_name: str):
+    owner = _AUTO_NOTES.get(str(event.widget))
+    if owner is not None:
+        getattr(owner, handler_name)(event)
+
+
 # -----------------------------
 # Collapsible auto-growing notes
 # - grows by lines up to max_lines
 # - no scrollbar
 # - collapse hides the Text widget
 # -----------------------------
-class CollapsibleAutoNotes(ttk.Frame):
+class CollapsibleAutoNotes(_Debounced, ttk.Frame):
     def __init__(self, parent, title: str, var: tk.StringVar, on_change=None, min_lines=3, max_lines=10):
         super().__init__(parent)
         self.title = title
@@ -302,17 +334,17 @@ class CollapsibleAutoNotes(ttk.Frame):
         # internal flags
         self._trace_id = None
         self._in_sync = False  # prevents feedback loops
+        self.text = None
+        self._alive = False  # Python-side "text exists" flag (no winfo_exists round trip)
 
         self._build()
+        self._alive = True
         self._load_var_into_text()
         self._apply_open_state()
 
-        # trace var updates from outside (rare)
+        # trace var updates from outside (rare); removed again in destroy()
         self._trace_id = self.var.trace_add("write", lambda *_: self._on_var_changed())
 
-        # IMPORTANT: remove trace when this widget is destroyed
-        self.bind("<Destroy>", self._on_destroy, add=True)
-
     def _build(self):
         top = ttk.Frame(self)
         top.pack(fill="x")
@@ -321,22 +353,31 @@ class CollapsibleAutoNotes(ttk.Frame):
         self.btn.pack(side="left")
 
         self.text = tk.Text(self, height=self.min_lines, wrap="word")
+        self._lines = self.min_lines
         self.text.pack(fill="x", expand=True, pady=(4, 0))
 
-        # sync text->var
-        self.text.bind("<KeyRelease>", self._sync_from_text)
-        self.text.bind("<<Modified>>", self._on_modified)
-
-    def _on_destroy(self, event=None):
-        # Only handle destruction of THIS frame, not every child widget
-        if event is not None and event.widget is not self:
-            return
+        # sync text->var: one shared class binding instead of per-widget binds.
+        # Class bindings live in the Tcl interpreter, so ask it (a new Tk root starts empty).
+        if not self.text.bind_class("AutoNotes"):
+            self.text.bind_class("AutoNotes", "<KeyRelease>", lambda e: _auto_notes_event(e, "_sync_from_text"))
+            self.text.bind_class("AutoNotes", "<<Modified>>", lambda e: _auto_notes_event(e, "_on_modified"))
+        _AUTO_NOTES[str(self.text)] = self
+        self.text.bindtags(("AutoNotes",) + self.text.bindtags())
+
+    def destroy(self):
+        # The var usually outlives this box: dropping the trace (its lambda holds
+        # self) is what lets the box be collected; self.var stays for late callers.
         try:
             if self._trace_id is not None:
                 self.var.trace_remove("write", self._trace_id)
-                self._trace_id = None
         except Exception:
             pass
+        self._trace_id = None
+        self._alive = False
+        if self.text is not None:
+            _AUTO_NOTES.pop(str(self.text), None)
+        self.text = None
+        super().destroy()
 
     def _toggle(self):
         self._open.set(not self._open.get())
@@ -345,15 +386,15 @@ class CollapsibleAutoNotes(ttk.Frame):
     def _apply_open_state(self):
         if self._open.get():
             self.btn.configure(text=f"{self.title}  ▲")
-            if hasattr(self, "text") and self.text.winfo_exists() and not self.text.winfo_ismapped():
+            if self._alive and not self.text.winfo_ismapped():
                 self.text.pack(fill="x", expand=True, pady=(4, 0))
         else:
             self.btn.configure(text=f"{self.title}  ▼")
-            if hasattr(self, "text") and self.text.winfo_exists() and self.text.winfo_ismapped():
+            if self._alive and self.text.winfo_ismapped():
                 self.text.pack_forget()
 
     def _on_modified(self, _evt=None):
-        if not (hasattr(self, "text") and self.text.winfo_exists()):
+        if not self._alive:
             return
         if self.text.edit_modified():
             self.text.edit_modified(False)
@@ -362,7 +403,7 @@ class CollapsibleAutoNotes(ttk.Frame):
     def _sync_from_text(self, _evt=None):
         if self._in_sync:
             return
-        if not (hasattr(self, "text") and self.text.winfo_exists()):
+        if not self._alive:
             return
 
         self._in_sync = True
@@ -371,54 +412,54 @@ class CollapsibleAutoNotes(ttk.Frame):
             # Only set if changed to avoid extra trace churn
             if (self.var.get() or "") != txt:
                 self.var.set(txt)
-            self._auto_resize(txt)
+            self._auto_resize()
         finally:
             self._in_sync = False
 
-        if callable(self.on_change):
-            self.on_change()
+        self._schedule_change()
 
-    def _auto_resize(self, txt: str):
-        if not (hasattr(self, "text") and self.text.winfo_exists()):
+    def _auto_resize(self):
+        if not self._alive:
             return
-        lines = (txt or "").count("\n") + 1
-        lines = max(self.min_lines, min(self.max_lines, lines))
         try:
-            self.text.configure(height=lines)
+            # Text already knows its line count; "end-1c" is "<last line>.<col>"
+            lines = int(self.text.index("end-1c").split(".", 1)[0])
+            lines = max(self.min_lines, min(self.max_lines, lines))
+            if lines != self._lines:
+                self.text.configure(height=lines)
+                self._lines = lines
         except Exception:
             pass
 
     def _load_var_into_text(self):
-        if not (hasattr(self, "text") and self.text.winfo_exists()):
+        if not self._alive:
+            return
+        v = self.var.get() or ""
+        if self.text.get("1.0", "end-1c") == v:
+            self._auto_resize()
             return
         self._in_sync = True
         try:
             self.text.delete("1.0", "end")
-            v = self.var.get() or ""
             self.text.insert("1.0", v)
-            self._auto_resize(v)
+            self._auto_resize()
         finally:
             self._in_sync = False
 
     def _on_var_changed(self):
         # Guard: this callback can fire after widget destruction if trace wasn't removed
-        if self._in_sync:
-            return
-        if not self.winfo_exists():
-            return
-        if not (hasattr(self, "text") and self.text.winfo_exists()):
+        if self._in_sync or not self._alive:
             return
 
-        # avoid fighting with user typing: only reload if text differs
+        # avoid fighting with user typing: only reloads if text differs
         try:
-            current = self.text.get("1.0", "end-1c")
-        except Exception:
-            return
-        target = self.var.get() or ""
-        if current != target:
             self._load_var_into_text()
+        except Exception:
+            pass
 
     def reset(self):
+        if not self._alive:
+            return
         self.var.set("")
         self._open.set(True)
         self._load_var_into_text()
@@ -428,7 +469,7 @@ class CollapsibleAutoNotes(ttk.Frame):
 # Palpation row:
 # Left severity + centered label + Right severity
 # -----------------------------
-class LRSeverityRow(ttk.Frame):
+class LRSeverityRow(_Debounced, ttk.Frame):
     def __init__(self, parent, text: str, on_change):
         super().__init__(parent)
         self.on_change = on_change
@@ -451,17 +492,16 @@ class LRSeverityRow(ttk.Frame):
         self.grid_columnconfigure(1, weight=1)
 
     def _changed(self):
-        if callable(self.on_change):
-            self.on_change()
+        self._schedule_change()
 
     def get_state(self) -> dict:
         return {"l_sev": int(self.l_sev.get()), "r_sev": int(self.r_sev.get())}
 
     def set_state(self, data: dict):
-        self.l_sev.set(int(data.get("l_sev", -1)))
-        self.r_sev.set(int(data.get("r_sev", -1)))
+        _set_int_var(self.l_sev, data.get("l_sev", -1))
+        _set_int_var(self.r_sev, data.get("r_sev", -1))
 
-class PalpationCompactRow(ttk.Frame):
+class PalpationCompactRow(_Debounced, ttk.Frame):
     """
     Layout:
     [Muscle name]  [Left 0-9 radios]
@@ -494,21 +534,20 @@ class PalpationCompactRow(ttk.Frame):
         self.grid_columnconfigure(1, weight=1)
 
     def _changed(self):
-        if callable(self.on_change):
-            self.on_change()
+        self._schedule_change()
 
     def get_state(self) -> dict:
         return {"l_sev": int(self.l_sev.get()), "r_sev": int(self.r_sev.get())}
 
     def set_state(self, data: dict):
-        self.l_sev.set(int(data.get("l_sev", -1)))
-        self.r_sev.set(int(data.get("r_sev", -1)))
+        _set_int_var(self.l_sev, data.get("l_sev", -1))
+        _set_int_var(self.r_sev, data.get("r_sev", -1))
 
 # -----------------------------
 # Orthopedic row:
 # Left: (-1 none / 0 Neg / 1 Pos)  label  Right: (-1 / 0 / 1)
 # -----------------------------
-class LROrthoRow(ttk.Frame):
+class LROrthoRow(_Debounced, ttk.Frame):
     def __init__(self, parent, text: str, on_change):
         super().__init__(parent)
         self.on_change = on_change
@@ -551,22 +590,21 @@ class LROrthoRow(ttk.Frame):
 
 
     def _changed(self):
-        if callable(self.on_change):
-            self.on_change()
+        self._schedule_change()
 
     def get_state(self) -> dict:
         return {"l_res": int(self.l_res.get()), "r_res": int(self.r_res.get())}
 
     def set_state(self, data: dict):
-        self.l_res.set(int(data.get("l_res", -1)))
-        self.r_res.set(int(data.get("r_res", -1)))
+        _set_int_var(self.l_res, data.get("l_res", -1))
+        _set_int_var(self.r_res, data.get("r_res", -1))
 
 # -----------------------------
 # ROM row:
 # Left: -1 none / 0 WNL / 1-9 restricted severity
 # Right same.
 # -----------------------------
-class LRROMRow(ttk.Frame):
+class LRROMRow(_Debounced, ttk.Frame):
     def __init__(self, parent, text: str, on_change, *, disable_right: bool = False):
         super().__init__(parent)
         self.on_change = on_change
@@ -581,20 +619,6 @@ class LRROMRow(ttk.Frame):
 
         self._build()
 
-        # If disabling, enforce it in two ways:
-        # 1) visually disable widgets
-        # 2) prevent right value from ever sticking
-        if self.disable_right:
-            self._set_right_enabled(False)
-
-            def _force_right_off(*_):
-                if int(self.r_sev.get()) != -1:
-                    try:
-                        self.r_sev.set(-1)
-                    except Exception:
-                        pass
-            self.r_sev.trace_add("write", _force_right_off)
-
     def _build(self):
         # Column 0: motion label on the LEFT
         ttk.Label(self, text=self.text, width=16, anchor="w").grid(
@@ -610,74 +634,32 @@ class LRROMRow(ttk.Frame):
         )
         self.left_grp.grid(row=0, column=1, sticky="w")
 
-        # Column 1: RIGHT radios (only if not disabled)
-        self.right_grp = ToggleRadioGroup(
-            self, SEVERITY_VALUES, self.r_sev,
-            on_change=self._changed,
-            btn_width=3
-        )
-
-        if self.disable_right:
-            # Keep logic intact: right stays -1, but don't show widgets
-            self.r_sev.set(-1)
-            self.right_grp.grid_forget()
-        else:
+        # Column 1: RIGHT radios (only if not disabled; r_sev then just stays -1)
+        if not self.disable_right:
+            self.right_grp = ToggleRadioGroup(
+                self, SEVERITY_VALUES, self.r_sev,
+                on_change=self._changed,
+                btn_width=3
+            )
             self.right_grp.grid(row=1, column=1, sticky="w", pady=(2, 0))
 
         # Keep it tight
         self.grid_columnconfigure(1, weight=1)
 
 
-    def _disable_widget_tree(self, w, state: str):
-        """Recursively set state on widget + all descendants."""
-        try:
-            # ttk uses "disabled"/"normal"
-            w.configure(state=state)
-        except Exception:
-            try:
-                # some ttk widgets want state([..]) style; ignore if not supported
-                w.state([state])
-            except Exception:
-                pass
-
-        try:
-            for c in w.winfo_children():
-                self._disable_widget_tree(c, state)
-        except Exception:
-            pass
-
-    def _set_right_enabled(self, enabled: bool):
-        if not enabled:
-            try:
-                self.r_sev.set(-1)
-            except Exception:
-                pass
-
-        state = "normal" if enabled else "disabled"
-
-        if self.right_grp is not None:
-            self._disable_widget_tree(self.right_grp, state)
-
     def _changed(self):
-        # If right is disabled, don't allow right changes to propagate
-        if self.disable_right:
-            try:
-                self.r_sev.set(-1)
-            except Exception:
-                pass
-
-        if callable(self.on_change):
-            self.on_change()
+        self._schedule_change()
 
     def get_state(self) -> dict:
-        return {"l_sev": int(self.l_sev.get()), "r_sev": int(self.r_sev.get())}
+        return {
+            "l_sev": int(self.l_sev.get()),
+            "r_sev": -1 if self.disable_right else int(self.r_sev.get()),
+        }
 
     def set_state(self, data: dict):
-        self.l_sev.set(int(data.get("l_sev", -1)))
-        self.r_sev.set(int(data.get("r_sev", -1)))
-
-        if self.disable_right:
-            self._set_right_enabled(False)
+        _set_int_var(self.l_sev, data.get("l_sev", -1))
+        if not self.disable_right:
+            _set_int_var(self.r_sev, data.get("r_sev", -1))
 
 # -----------------------------
 # Global (Vitals / Inspection) panel
@@ -685,10 +667,12 @@ class LRROMRow(ttk.Frame):
 # - shows Vitals/Posture/Grip
 # - each has its own Notes box
 # -----------------------------
-class VitalsInspectionPanel(ttk.Frame):
+class VitalsInspectionPanel(_Debounced, ttk.Frame):
     def __init__(self, parent, on_change):
         super().__init__(parent)
         self.on_change = on_change
+        # has_content() result; cleared by every change notice and load (None = rescan)
+        self._has_content_cache: bool | None = None
 
         # def open(self, which: str | None = None):
         #     """Ensure the panel is expanded and optionally choose a sub-tab."""
@@ -754,6 +738,13 @@ class VitalsInspectionPanel(ttk.Frame):
         self.sublux_notes_var = tk.StringVar(value="")
         self.grip_notes_var = tk.StringVar(value="")
 
+        # Section widgets are built on first reveal (see _show_active)
+        self._built: set[str] = set()
+        self.sublux_preview: ttk.Label | None = None
+
+        self._init_adl_rows_from_global()
+        self._load_global_adl_prefix()
+
         self._build_ui()
         self._wire_traces()
 
@@ -780,6 +771,7 @@ class VitalsInspectionPanel(ttk.Frame):
         self.active.trace_add("write", lambda *_: self._show_active())
 
     def _load_global_adl_prefix(self) -> None:
+        self._has_content_cache = None
         self._adl_prefix_sync = True
         try:
             self.adl_prefix_var.set(get_global_adl_prefix())
@@ -799,8 +791,13 @@ class VitalsInspectionPanel(ttk.Frame):
 
         ttk.Button(top, text="Vitals / Inspection", command=self._toggle_open).pack(side="left")
 
+        # Section radios are built once; _apply_open_state only packs/unpacks the frame
         self.radios_frame = ttk.Frame(top)
-        self.radios_frame.pack(side="left", padx=(12, 0))
+        names = ("Vitals", "Posture", "Subluxations", "Grip", "ADLs")
+        for name in names:
+            ttk.Radiobutton(self.radios_frame, text=name, value=name, variable=self.active).pack(
+                side="left", padx=(0, 8) if name != names[-1] else 0
+            )
 
         self.container = ttk.Frame(self)
         self.container.pack(fill="both", expand=True, padx=10, pady=(0, 8))
@@ -816,13 +813,13 @@ class VitalsInspectionPanel(ttk.Frame):
         for f in (self.vitals_frame, self.posture_frame, self.sublux_frame, self.grip_frame, self.adl_frame):
             f.grid(row=0, column=0, sticky="nsew")
 
-        self.container.update_idletasks()
-
-        self._build_vitals_panel()
-        self._build_posture_panel()
-        self._build_sublux_panel()
-        self._build_grip_panel()
-        self._build_adl_panel()  # ✅ NEW
+        self._sections = {
+            "Vitals": (self.vitals_frame, self._build_vitals_panel),
+            "Posture": (self.posture_frame, self._build_posture_panel),
+            "Subluxations": (self.sublux_frame, self._build_sublux_panel),
+            "Grip": (self.grip_frame, self._build_grip_panel),
+            "ADLs": (self.adl_frame, self._build_adl_panel),
+        }
 
         self._apply_open_state()
 
@@ -832,35 +829,25 @@ class VitalsInspectionPanel(ttk.Frame):
         self._changed()
 
     def _apply_open_state(self):
-        for w in self.radios_frame.winfo_children():
-            w.destroy()
-
         if self._open.get():
-            ttk.Radiobutton(self.radios_frame, text="Vitals", value="Vitals", variable=self.active).pack(side="left", padx=(0, 8))
-            ttk.Radiobutton(self.radios_frame, text="Posture", value="Posture", variable=self.active).pack(side="left", padx=(0, 8))
-            ttk.Radiobutton(self.radios_frame, text="Subluxations", value="Subluxations", variable=self.active).pack(side="left", padx=(0, 8))
-            ttk.Radiobutton(self.radios_frame, text="Grip", value="Grip", variable=self.active).pack(side="left", padx=(0, 8))
-            ttk.Radiobutton(self.radios_frame, text="ADLs", value="ADLs", variable=self.active).pack(side="left")
-
+            self.radios_frame.pack(side="left", padx=(12, 0))
             self.container.pack(fill="both", expand=True, padx=10, pady=(0, 8))
             self._show_active()
         else:
+            self.radios_frame.pack_forget()
             self.container.pack_forget()
 
     def _show_active(self):
         if not self._open.get():
             return
         which = self.active.get()
-        if which == "Vitals":
-            self.vitals_frame.tkraise()        
-        elif which == "Posture":
-            self.posture_frame.tkraise()
-        elif which == "Subluxations":
-            self.sublux_frame.tkraise()
-        elif which == "Grip":
-            self.grip_frame.tkraise()
-        else:
-            self.adl_frame.tkraise()
+        if which not in self._sections:
+            which = "ADLs"
+        frame, build = self._sections[which]
+        if which not in self._built:
+            self._built.add(which)
+            build()
+        frame.tkraise()
 
 
     def _build_vitals_row(self, f):
@@ -1094,6 +1081,7 @@ class VitalsInspectionPanel(ttk.Frame):
         self._build_sublux_row(f)
         notes = CollapsibleAutoNotes(f, "Subluxation Notes", self.sublux_notes_var, on_change=self._changed)
         notes.grid(row=1, column=0, columnspan=100, sticky="ew", pady=(8, 0))
+        self._update_sublux_preview_only()
 
     def _build_grip_panel(self):
         f = self.grip_frame
@@ -1127,7 +1115,7 @@ class VitalsInspectionPanel(ttk.Frame):
 
         if not self.adl_entry_rows:
             self._init_adl_rows_from_global()
-            self._render_adl_entry_rows()
+        self._render_adl_entry_rows()
 
         prefix_fr = ttk.Frame(body)
         prefix_fr.grid(row=1, column=0, sticky="ew", pady=(4, 4))
@@ -1136,7 +1124,6 @@ class VitalsInspectionPanel(ttk.Frame):
         ttk.Entry(prefix_fr, textvariable=self.adl_prefix_var).grid(
             row=0, column=1, sticky="ew", padx=(8, 0)
         )
-        self._load_global_adl_prefix()
 
         btn_fr = ttk.Frame(body)
         btn_fr.grid(row=2, column=0, sticky="w", pady=(2, 4))
@@ -1152,10 +1139,10 @@ class VitalsInspectionPanel(ttk.Frame):
 
     def _clear_all_adl_ratings(self) -> None:
         for row in self.adl_entry_rows:
-            row["severity"].set(-1)
-            cb = row.get("combo")
-            if cb is not None:
-                cb.set("(select)")
+            row["severity"] = -1
+            sp = row.get("spin")
+            if sp is not None:
+                sp.set("(select)")
         self._changed()
 
     def _refresh_adl_scroll(self) -> None:
@@ -1173,11 +1160,7 @@ class VitalsInspectionPanel(ttk.Frame):
             label = (row.get("label") or "").strip()
             if not label:
                 continue
-            try:
-                sev = int(row["severity"].get())
-            except Exception:
-                sev = -1
-            out[label] = sev
+            out[label] = row["severity"]
         return out
 
     def _init_adl_rows_from_global(self, severities: dict[str, int] | None = None) -> None:
@@ -1198,10 +1181,11 @@ class VitalsInspectionPanel(ttk.Frame):
         label = (label or "").strip()
         if not label:
             return
-        sev_var = tk.IntVar(value=int(severity) if int(severity) >= 0 else -1)
-        sev_var.trace_add("write", lambda *_: self._changed())
+        # Plain int, not an IntVar: the combobox handler is the only writer and
+        # already reports the change, so a Tcl variable + trace per item bought nothing.
+        sev = int(severity)
         self.adl_entry_rows.append(
-            {"label": label, "severity": sev_var, "legacy": bool(legacy)}
+            {"label": label, "severity": sev if sev >= 0 else -1, "legacy": bool(legacy)}
         )
         if render:
             self._render_adl_entry_rows(select_label=label)
@@ -1261,25 +1245,28 @@ class VitalsInspectionPanel(ttk.Frame):
             lbl.pack(side="left")
             lbl.bind("<Button-1>", lambda _e, lbl_text=label: self._select_adl_row(lbl_text))
 
-            cb = ttk.Combobox(
+            # Spinbox over the same choices: no popdown listbox per item;
+            # position in ADL_SEV_CHOICES is severity + 1 ("(select)" -> -1)
+            sp = ttk.Spinbox(
                 inner,
                 values=ADL_SEV_CHOICES,
                 width=8,
                 state="readonly",
+                wrap=False,
             )
-            self._disable_mousewheel_on_cb(cb)
-            sev = int(row["severity"].get())
-            cb.set(str(sev) if 0 <= sev <= 9 else "(select)")
-
-            def _make_handler(var: tk.IntVar, combobox: ttk.Combobox):
-                def _on_selected(_evt=None):
-                    v = (combobox.get() or "").strip()
-                    var.set(int(v) if v.isdigit() else -1)
+            self._disable_mousewheel_on_cb(sp)
+            sev = row["severity"]
+            sp.set(ADL_SEV_CHOICES[sev + 1] if 0 <= sev <= 9 else "(select)")
+
+            def _make_handler(entry: dict, spinbox: ttk.Spinbox):
+                def _on_spin():
+                    v = spinbox.get()
+                    entry["severity"] = ADL_SEV_CHOICES.index(v) - 1 if v in ADL_SEV_CHOICES else -1
                     self._changed()
-                return _on_selected
+                return _on_spin
 
-            cb.bind("<<ComboboxSelected>>", _make_handler(row["severity"], cb))
-            cb.pack(side="left", padx=(4, 0))
+            sp.configure(command=_make_handler(row, sp))
+            sp.pack(side="left", padx=(4, 0))
 
             if is_global:
                 down_target = _adl_index_from_grid_column_major(grid_r + 1, grid_c, global_count)
@@ -1301,7 +1288,7 @@ class VitalsInspectionPanel(ttk.Frame):
                     command=lambda idx=i: self._move_adl_item(idx, 1),
                 ).pack(side="left", padx=(1, 0))
 
-            row["combo"] = cb
+            row["spin"] = sp
 
         self._refresh_adl_scroll()
 
@@ -1574,7 +1561,8 @@ class VitalsInspectionPanel(ttk.Frame):
         if level_parts:
             parts.append("Specific levels: " + "; ".join(level_parts) + ".")
 
-        self.sublux_preview.config(text=" ".join(parts).strip())
+        if self.sublux_preview is not None:
+            self.sublux_preview.config(text=" ".join(parts).strip())
         
 
     def _update_sublux(self):
@@ -1603,10 +1591,15 @@ class VitalsInspectionPanel(ttk.Frame):
 
 
     def _changed(self):
-        if callable(self.on_change):
-            self.on_change()
+        self._has_content_cache = None
+        self._schedule_change()
 
     def has_content(self) -> bool:
+        if self._has_content_cache is None:
+            self._has_content_cache = bool(self._scan_content())
+        return self._has_content_cache
+
+    def _scan_content(self):
         vitals_any = any([
             self.bp_var.get().strip(),
             self.pulse_var.get().strip(),
@@ -1640,7 +1633,7 @@ class VitalsInspectionPanel(ttk.Frame):
 
         adl_any = (
             (self.adl_prefix_var.get() or "").strip()
-            or any(int(r["severity"].get()) >= 0 for r in self.adl_entry_rows)
+            or any(r["severity"] >= 0 for r in self.adl_entry_rows)
             or (self.adl_notes_var.get() or "").strip()
         )
 
@@ -1682,7 +1675,7 @@ class VitalsInspectionPanel(ttk.Frame):
             },
             "adl": {
                 "entries": [
-                    {"label": r["label"], "severity": int(r["severity"].get())}
+                    {"label": r["label"], "severity": r["severity"]}
                     for r in self.adl_entry_rows
                 ],
                 "notes": self.adl_notes_var.get(),
@@ -1691,6 +1684,7 @@ class VitalsInspectionPanel(ttk.Frame):
 
     def from_dict(self, data: dict):
         data = data or {}
+        self._has_content_cache = None
         self._open.set(bool(data.get("open", False)))
         self.active.set(data.get("active", "Vitals"))
 
@@ -1748,6 +1742,8 @@ class VitalsInspectionPanel(ttk.Frame):
 
         self._load_adl_from_dict(data.get("adl") or {})
         self._apply_open_state()
+        self._has_content_cache = None
+        self._flush_change()
 
     def reset(self):
         self.bp_var.set("")
@@ -1775,10 +1771,8 @@ class VitalsInspectionPanel(ttk.Frame):
         self._load_global_adl_prefix()
         self.adl_notes_var.set("")
         self.adl_selected_label = None
-        self.adl_entry_rows = []
-        if self.adl_items_frame is not None:
-            self._init_adl_rows_from_global()
-            self._render_adl_entry_rows()
+        self._init_adl_rows_from_global()
+        self._render_adl_entry_rows()
 
         # ✅ Sublux reset (PUT IT HERE)
         for v in self.sublux_region_vars.values():
@@ -1803,7 +1797,8 @@ class VitalsInspectionPanel(ttk.Frame):
         self.active.set("Vitals")
 
         self._apply_open_state()
-        self._changed()
+        self._has_content_cache = None
+        self._flush_change()
 
 # -----------------------------
 # One Objectives Block (region-specific)
@@ -2004,7 +1999,7 @@ class ObjectivesBlock(ttk.Frame):
             )
 
         # Ortho rows
-        ortho_items = REGION_ORTHO_TESTS.get(code, []) or []
+        ortho_items = REGION_ORTHO_TESTS.get(code, ())
         if ortho_items:
             for item in ortho_items:
                 row = LROrthoRow(self.ortho_frame, item, self._changed)
@@ -2014,7 +2009,7 @@ class ObjectivesBlock(ttk.Frame):
             ttk.Label(self.ortho_frame, text="(No orthopedic tests configured)").pack(anchor="w", padx=10, pady=10)
         
         # ROM rows
-        rom_items = REGION_ROM_MOTIONS.get(code, []) or []
+        rom_items = REGION_ROM_MOTIONS.get(code, ())
         if rom_items:
             code_norm = (code or "").strip().upper()
             is_spine = any(k in code_norm for k in ("CERV", "THOR", "LUMB", "C/S", "T/S", "L/S", "CS", "TS", "LS", "SPINE"))
@@ -11,7 +11,7 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 
-from config import PATIENTS_ID_ROOT
+from config import PATIENTS_ID_ROOT, patients_id_root
 from utils import ensure_named_patient_folder, find_patient_folder_by_id
 
 
@@ -26,8 +26,7 @@ def get_patient_root(patient_id: str, last: str = "", first: str = "") -> Path:
     Creates the folder if needed; renames to {last}_{first}__{patient_id} when names are set.
     Compatible with existing id_cases layout.
     """
-    root = Path(PATIENTS_ID_ROOT)
-    root.mkdir(parents=True, exist_ok=True)
+    root = patients_id_root()
     return ensure_named_patient_folder(root, patient_id, (last or "").strip(), (first or "").strip())
 
 
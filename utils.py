@@ -5,7 +5,7 @@ from datetime import datetime
 from pathlib import Path
 
 from config import (
-    YEAR_CASES_ROOT,
+    ensure_dirs,
     PATIENT_SUBDIR_EXAMS, PATIENT_SUBDIR_PDFS, PATIENT_SUBDIR_ROFS, PATIENT_SUBDIR_INFO,
     PATIENT_SUBDIR_IMAGING, PATIENT_SUBDIR_ATTORNEY, PATIENT_SUBDIR_BILLING, PATIENT_SUBDIR_MESSAGES,
     REGION_LABELS
@@ -100,7 +100,7 @@ def to_last_first(last: str, first: str) -> str:
     return last or first
 
 def ensure_year_root():
-    os.makedirs(str(YEAR_CASES_ROOT), exist_ok=True)
+    ensure_dirs()
 
 def _date_for_folder(mmddyyyy_or_yyyy_mm_dd: str) -> str:
     """